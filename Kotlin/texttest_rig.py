@@ -1,14 +1,16 @@
 #!/usr/bin/env python
 """
-This script uses Gradle to execute the TexttestFixture.
+This script executes the TexttestFixture through the shared warm rig in 'texttests/warm_rig.py'.
 It is designed to be used by TextTest and specified in the file 'texttests/config.gr' in this repo.
-It is more convenient for TextTest to use since Gradle needs
-several arguments in addition to the one the TextTest fixture needs.
+The fixture is built with Gradle once, and again only when the sources change,
+so each TextTest run only pays for starting the fixture itself.
 """
 import os
-import subprocess
 import sys
 
-args = " ".join(sys.argv[1:])
 TEXTTEST_HOME = os.environ.get("TEXTTEST_HOME", os.getcwd())
-subprocess.run(f"{TEXTTEST_HOME}/Kotlin/gradlew -p {TEXTTEST_HOME}/Kotlin -q run --args {args}", shell=True)
+sys.path.insert(0, os.path.join(TEXTTEST_HOME, "texttests"))
+
+from warm_rig import main
+
+sys.exit(main(["kotlin", *sys.argv[1:]]))
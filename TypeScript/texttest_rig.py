@@ -1,14 +1,16 @@
 #!/usr/bin/env python
 """
-This script uses npx to execute the TextTest Fixture for TypeScript.
+This script executes the TexttestFixture through the shared warm rig in 'texttests/warm_rig.py'.
 It is designed to be used by TextTest and specified in the file 'texttests/config.gr' in this repo.
-It is more convenient for TextTest to use since npx needs
-several arguments in addition to the one the TextTest fixture needs.
+The fixture is built with tsc once, and again only when the sources change,
+so each TextTest run only pays for starting the fixture itself.
 """
 import os
-import subprocess
 import sys
 
-args = " ".join(sys.argv[1:])
 TEXTTEST_HOME = os.environ.get("TEXTTEST_HOME", os.getcwd())
-subprocess.run(f"npx ts-node {TEXTTEST_HOME}/TypeScript/test/golden-master-text-test.ts {args}", shell=True)
+sys.path.insert(0, os.path.join(TEXTTEST_HOME, "texttests"))
+
+from warm_rig import main
+
+sys.exit(main(["typescript", *sys.argv[1:]]))
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks for the bulk, pipelined and batched inventory paths.
+
+Each benchmark times a path against the straightforward code it replaces,
+after checking that both produce the same result. Timings are the best of
+several interleaved runs, so background load affects both sides alike.
+
+    python benchmarks.py ingestion --size 200000
+    python benchmarks.py pipeline --size 300000
+    python benchmarks.py simulation --size 30000
+"""
+import argparse
+import io
+import itertools
+import random
+import time
+import timeit
+
+import bulk_ingestion
+from bulk_ingestion import _to_int, ingest_columns, ingest_rows
+from columnar_inventory import MAX_VALUE, MIN_VALUE, ColumnarInventory
+from gilded_rose import (
+    AGED_BRIE,
+    BACKSTAGE_PASSES,
+    MAX_QUALITY,
+    MIN_QUALITY,
+    SULFURAS,
+    SULFURAS_QUALITY,
+    GildedRose,
+    Item,
+)
+from inventory_pipeline import DEFAULT_CHUNK_SIZE, roll_over_file, roll_over_lines
+from scenario_simulation import sample, simulate
+
+# Simulated storage latency per thousand lines read or written
+IO_LATENCY = 0.002
+
+
+def best_times(functions, repeat=5):
+    """Time argument-less callables in turn and return each one's best time."""
+    best = [float("inf")] * len(functions)
+    for _ in range(repeat):
+        for index, function in enumerate(functions):
+            best[index] = min(best[index], timeit.timeit(function, number=1))
+    return best
+
+
+def ingestion_feed(size, seed=37):
+    """Generate a feed of mostly valid rows with string sell_in values.
+
+    Args:
+        size: Number of rows.
+        seed: Seed for the random generator.
+
+    Returns:
+        List of (name, sell_in, quality) tuples.
+    """
+    rng = random.Random(seed)
+    names = [AGED_BRIE, SULFURAS, "Elixir of the Mongoose", " Conjured Mana Cake "]
+    rows = []
+    for _ in range(size):
+        name = rng.choice(names)
+        quality = SULFURAS_QUALITY if name == SULFURAS else rng.randint(-1, 51)
+        rows.append((name, str(rng.randint(-5, 20)), quality))
+    return rows
+
+
+def ingest_per_item(rows):
+    """Baseline for ingestion: validate each row on its own and build an Item for it.
+
+    Args:
+        rows: Iterable of (name, sell_in, quality) rows.
+
+    Returns:
+        Tuple of (ColumnarInventory of accepted rows, rejected row numbers).
+    """
+    items, rejected = [], []
+    for row, fields in enumerate(rows):
+        try:
+            name, sell_in, quality = fields
+        except (TypeError, ValueError):
+            rejected.append(row)
+            continue
+        name = name.strip() if isinstance(name, str) else None
+        sell_in, quality = _to_int(sell_in), _to_int(quality)
+        if not name or sell_in is None or quality is None:
+            rejected.append(row)
+            continue
+        legendary = name == SULFURAS
+        if (not MIN_VALUE <= sell_in <= MAX_VALUE or quality < MIN_QUALITY
+                or legendary and quality != SULFURAS_QUALITY
+                or not legendary and quality > MAX_QUALITY):
+            rejected.append(row)
+            continue
+        items.append(Item(name, sell_in, quality))
+    return ColumnarInventory.from_items(items), rejected
+
+
+def benchmark_ingestion(size):
+    """Time ingest_rows, and ingest_columns on NumPy arrays, against ingest_per_item.
+
+    Returns:
+        List of (label, seconds) pairs.
+    """
+    rows = ingestion_feed(size)
+    inventory, rejected = ingest_per_item(rows)
+    result = ingest_rows(rows)
+    assert rejected == [rejection.row for rejection in result.rejected]
+    assert [repr(item) for item in inventory.to_items()] == \
+        [repr(item) for item in result.inventory.to_items()]
+
+    labels = ["per-item loop", "ingest_rows"]
+    functions = [lambda: ingest_per_item(rows), lambda: ingest_rows(rows)]
+    numpy = bulk_ingestion.numpy
+    if numpy is not None:
+        names = [name for name, _, _ in rows]
+        sell_in = numpy.array([int(value) for _, value, _ in rows])
+        quality = numpy.array([value for _, _, value in rows])
+        labels.append("ingest_columns (NumPy)")
+        functions.append(lambda: ingest_columns(names, sell_in, quality))
+    return list(zip(labels, best_times(functions)))
+
+
+class SlowStorage:
+    """Text file wrapper that sleeps like slow storage, releasing the GIL meanwhile."""
+
+    def __init__(self, text="", latency=IO_LATENCY):
+        self._file = io.StringIO(text)
+        self._latency = latency
+        self._lines = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        self._lines += 1
+        if self._lines % 1000 == 0:
+            time.sleep(self._latency)
+        return next(self._file)
+
+    def write(self, text):
+        time.sleep(self._latency * text.count("\n") / 1000)
+        return self._file.write(text)
+
+    def getvalue(self):
+        return self._file.getvalue()
+
+
+def roll_over_sequentially(source, destination, days=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Baseline for the pipeline: read, update and write each chunk in turn."""
+    while True:
+        chunk = list(itertools.islice(source, chunk_size))
+        if not chunk:
+            return
+        destination.write(roll_over_lines(chunk, days))
+
+
+def benchmark_pipeline(size):
+    """Time roll_over_file against a sequential loop, with and without slow storage.
+
+    Returns:
+        List of (label, seconds) pairs.
+    """
+    rng = random.Random(34)
+    names = ["Normal Item", AGED_BRIE, SULFURAS, "Conjured Mana Cake"]
+    text = "".join("%s, %d, %d\n" % (rng.choice(names), rng.randint(-5, 20), rng.randint(0, 50))
+                   for _ in range(size))
+    results = []
+    for storage, latency in (("in memory", 0), ("slow storage", IO_LATENCY)):
+        outputs = []
+
+        def run(roll_over):
+            destination = SlowStorage(latency=latency)
+            roll_over(SlowStorage(text, latency), destination)
+            outputs.append(destination.getvalue())
+
+        sequential, pipelined = best_times([lambda: run(roll_over_sequentially),
+                                            lambda: run(roll_over_file)], repeat=3)
+        assert len(set(outputs)) == 1
+        results.append((f"sequential, {storage}", sequential))
+        results.append((f"roll_over_file, {storage}", pipelined))
+    return results
+
+
+def simulate_per_item(slots, days):
+    """Baseline for simulation: one GildedRose over an Item per scenario."""
+    items = [Item(*state) for states in slots for state in states]
+    gilded_rose = GildedRose(items)
+    for _ in range(days):
+        gilded_rose.update_quality()
+    return items
+
+
+def benchmark_simulation(size, days=30):
+    """Time simulate() against updating one Item per scenario, on sampled slots.
+
+    Returns:
+        List of (label, seconds) pairs.
+    """
+    slots = [
+        sample(name, lambda rng: rng.randint(-5, 30), lambda rng: rng.randint(0, 50),
+               size // 3, seed=36)
+        for name in ("Normal Item", AGED_BRIE, BACKSTAGE_PASSES)
+    ]
+    items = simulate_per_item(slots, days)
+    final = simulate(slots, days)[-1]
+    for index, summary in enumerate(final.slots):
+        qualities = [item.quality for item in items[index * len(slots[0]):(index + 1) * len(slots[0])]]
+        assert summary.mean_quality == sum(qualities) / len(qualities)
+    per_item, batched = best_times([lambda: simulate_per_item(slots, days),
+                                    lambda: simulate(slots, days)])
+    return [(f"per-item loop, {days} days", per_item), (f"simulate, {days} days", batched)]
+
+
+BENCHMARKS = {
+    "ingestion": benchmark_ingestion,
+    "pipeline": benchmark_pipeline,
+    "simulation": benchmark_simulation,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the bulk inventory paths against their baselines.")
+    parser.add_argument("benchmarks", nargs="*",
+                        help="benchmarks to run: %s (default: all)" % ", ".join(sorted(BENCHMARKS)))
+    parser.add_argument("--size", type=int, default=200000, help="items or rows per benchmark")
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.benchmarks) - set(BENCHMARKS))
+    if unknown:
+        parser.error("unknown benchmark: %s" % ", ".join(unknown))
+    for name in args.benchmarks or sorted(BENCHMARKS):
+        print(name)
+        for label, seconds in BENCHMARKS[name](args.size):
+            print(f"  {label:<32} {seconds:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""Bulk ingestion and validation of incoming inventory feeds.
+
+Feeds arrive as rows, as columns or as files of "name, sell_in, quality"
+lines. Each row is checked in a single pass, and the accepted rows go
+straight into a ColumnarInventory without creating Item objects. When NumPy
+is installed, integer columns given to ingest_columns are checked with
+whole-column comparisons instead. Rejected rows are reported together with
+the reason for the first rule they broke:
+
+    - the row must have a name, sell_in and quality;
+    - the name must be a non-empty string;
+    - sell_in and quality must be integers, written without digit
+      separators when given as strings;
+    - sell_in must fit the inventory's 32-bit column;
+    - quality must not be below MIN_QUALITY;
+    - quality must not exceed MAX_QUALITY, except for Sulfuras;
+    - Sulfuras must have exactly SULFURAS_QUALITY.
+
+Names are normalized by stripping surrounding whitespace.
+"""
+import collections
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional; rows are then checked one by one
+    numpy = None
+
+from columnar_inventory import MAX_VALUE, MIN_VALUE, SULFURAS_ITEM, ColumnarInventory, category_of
+from gilded_rose import MAX_QUALITY, MIN_QUALITY, SULFURAS_QUALITY
+
+Rejection = collections.namedtuple("Rejection", "row reason")
+IngestionResult = collections.namedtuple("IngestionResult", "inventory rejected")
+
+# Reasons in rule order; the index is the failure code used by _ingest_arrays
+_REASONS = (
+    None,
+    "expected name, sell_in and quality",
+    "missing name",
+    "name is not a string",
+    "sell_in is not an integer",
+    "sell_in out of range",
+    "quality is not an integer",
+    f"quality below {MIN_QUALITY}",
+    f"quality above {MAX_QUALITY}",
+    f"Sulfuras quality is not {SULFURAS_QUALITY}",
+)
+(_ACCEPTED, _WRONG_SHAPE, _MISSING_NAME, _NAME_NOT_STRING, _BAD_SELL_IN, _SELL_IN_RANGE,
+ _BAD_QUALITY, _BELOW_MIN, _ABOVE_MAX, _NOT_LEGENDARY) = range(len(_REASONS))
+
+
+def _to_int(value):
+    """Convert an int or plain integer string, returning None if it is neither."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    text = value if isinstance(value, str) else str(value)
+    if "_" in text:  # int() accepts digit separators such as "1_000"
+        return None
+    try:
+        return int(text)  # int() ignores surrounding whitespace itself
+    except ValueError:
+        return None
+
+
+def _ingest(rows):
+    """Validate rows in one pass and build the inventory from the accepted ones."""
+    seen = {}  # raw name -> (stripped name, is Sulfuras), so each name is checked once
+    dictionary = {}
+    name_codes, sell_in_column, quality_column, rejected = [], [], [], []
+    for index, row in enumerate(rows):
+        try:
+            name, sell_in, quality = row
+        except (TypeError, ValueError):
+            rejected.append(Rejection(index, _REASONS[_WRONG_SHAPE]))
+            continue
+        if type(sell_in) is not int:
+            sell_in = _to_int(sell_in)
+        if type(quality) is not int:
+            quality = _to_int(quality)
+
+        if isinstance(name, str):
+            known = seen.get(name)
+            if known is None:
+                stripped = name.strip()
+                known = seen[name] = (stripped, category_of(stripped) == SULFURAS_ITEM)
+            name, legendary = known
+
+        if not isinstance(name, str):
+            failure = _MISSING_NAME if name is None else _NAME_NOT_STRING
+        elif not name:
+            failure = _MISSING_NAME
+        elif sell_in is None:
+            failure = _BAD_SELL_IN
+        elif not MIN_VALUE <= sell_in <= MAX_VALUE:
+            failure = _SELL_IN_RANGE
+        elif quality is None:
+            failure = _BAD_QUALITY
+        elif quality < MIN_QUALITY:
+            failure = _BELOW_MIN
+        elif legendary:
+            failure = _NOT_LEGENDARY if quality != SULFURAS_QUALITY else _ACCEPTED
+        else:
+            failure = _ABOVE_MAX if quality > MAX_QUALITY else _ACCEPTED
+
+        if failure:
+            rejected.append(Rejection(index, _REASONS[failure]))
+        else:
+            name_codes.append(dictionary.setdefault(name, len(dictionary)))
+            sell_in_column.append(sell_in)
+            quality_column.append(quality)
+    inventory = ColumnarInventory(dictionary, name_codes, sell_in_column, quality_column)
+    return IngestionResult(inventory, rejected)
+
+
+def _ingest_arrays(names, sell_in, quality):
+    """Validate integer NumPy columns with whole-column comparisons."""
+    distinct = {}
+    try:
+        # Dictionary-encode the names, so each distinct name is checked once
+        rows = numpy.fromiter((distinct.setdefault(name, len(distinct)) for name in names),
+                              numpy.intp, len(names))
+    except TypeError:  # an unhashable name; check the rows one by one instead
+        return _ingest(zip(names, sell_in.tolist(), quality.tolist()))
+    stripped = [name.strip() if isinstance(name, str) else name for name in distinct]
+    name_failures = numpy.array([
+        (_ACCEPTED if name else _MISSING_NAME) if isinstance(name, str)
+        else _MISSING_NAME if name is None else _NAME_NOT_STRING
+        for name in stripped
+    ], dtype=numpy.int8)[rows]
+    legendary = numpy.array([
+        isinstance(name, str) and category_of(name) == SULFURAS_ITEM for name in stripped
+    ], dtype=bool)[rows]
+
+    # Later assignments win, so the rules are applied in reverse order
+    failures = numpy.zeros(len(rows), dtype=numpy.int8)
+    failures[~legendary & (quality > MAX_QUALITY)] = _ABOVE_MAX
+    failures[legendary & (quality != SULFURAS_QUALITY)] = _NOT_LEGENDARY
+    failures[quality < MIN_QUALITY] = _BELOW_MIN
+    failures[(sell_in < MIN_VALUE) | (sell_in > MAX_VALUE)] = _SELL_IN_RANGE
+    failures = numpy.where(name_failures != _ACCEPTED, name_failures, failures)
+
+    accepted = failures == _ACCEPTED
+    dictionary = {}
+    name_codes = [dictionary.setdefault(stripped[code], len(dictionary))
+                  for code in rows[accepted].tolist()]
+    inventory = ColumnarInventory(
+        dictionary, name_codes, sell_in[accepted].tolist(), quality[accepted].tolist()
+    )
+    rejected = [Rejection(row, _REASONS[failures[row]])
+                for row in numpy.flatnonzero(~accepted).tolist()]
+    return IngestionResult(inventory, rejected)
+
+
+def _integer_array(values):
+    """Return values as an integer NumPy array, or None if they are not all integers."""
+    values = numpy.asarray(values)
+    return values if values.ndim == 1 and values.dtype.kind in "iu" else None
+
+
+def ingest_columns(names, sell_in, quality):
+    """Validate and load an inventory given as three columns.
+
+    Args:
+        names: Sequence of item names.
+        sell_in: Sequence of sell_in values, as ints or integer strings,
+            or an integer NumPy array.
+        quality: Sequence of quality values, as ints or integer strings,
+            or an integer NumPy array.
+
+    Returns:
+        IngestionResult with the ColumnarInventory of accepted rows and a
+        list of Rejections whose row is the 0-based position in the input.
+
+    Raises:
+        ValueError: If the columns differ in length.
+    """
+    if not len(names) == len(sell_in) == len(quality):
+        raise ValueError("columns must have the same length")
+    if numpy is not None:
+        sell_in_array, quality_array = _integer_array(sell_in), _integer_array(quality)
+        if sell_in_array is not None and quality_array is not None:
+            return _ingest_arrays(names, sell_in_array, quality_array)
+    return _ingest(zip(names, sell_in, quality))
+
+
+def ingest_rows(rows):
+    """Validate and load an inventory given as (name, sell_in, quality) rows.
+
+    Args:
+        rows: Iterable of (name, sell_in, quality) sequences. Anything
+            else, such as None or a row of the wrong length, is rejected.
+
+    Returns:
+        IngestionResult, as for ingest_columns.
+    """
+    return _ingest(rows)
+
+
+def ingest_file(stream):
+    """Validate and load an inventory file of "name, sell_in, quality" lines.
+
+    Blank lines are skipped but still counted, so a rejection's row is the
+    0-based line number.
+
+    Args:
+        stream: Readable text file.
+
+    Returns:
+        IngestionResult, as for ingest_columns.
+    """
+    rows = []
+    blank = []
+    for line in stream:
+        line = line.rstrip("\r\n")
+        blank.append(not line.strip())
+        rows.append(line.rsplit(",", 2))
+    result = ingest_rows(rows)
+    if not any(blank):
+        return result
+    rejected = [rejection for rejection in result.rejected if not blank[rejection.row]]
+    return IngestionResult(result.inventory, rejected)
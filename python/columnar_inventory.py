@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""Columnar inventory exposing its state through the buffer protocol.
+
+ColumnarInventory keeps sell_in, quality and category codes in contiguous
+arrays, and names as a dictionary-encoded column (a list of distinct names
+plus one code per item). Each column is exported as a read-only memoryview,
+so NumPy, Arrow and similar libraries can wrap it without copying. Updates
+are applied in place, so exported views stay valid and always show the
+current day.
+
+The update rules are not restated here: each category is mapped to the
+GildedRose strategy for that category, which is applied to a scratch Item.
+A rule change in gilded_rose.py therefore applies to columnar inventories
+too. New categories, such as Conjured items, also need a category code here.
+"""
+from array import array
+
+from gilded_rose import AGED_BRIE, BACKSTAGE_PASSES, SULFURAS, GildedRose, Item
+
+# Category codes stored in the categories column
+NORMAL_ITEM = 0
+AGED_BRIE_ITEM = 1
+BACKSTAGE_PASS_ITEM = 2
+SULFURAS_ITEM = 3
+
+# Bounds of the sell_in, quality and name code columns
+MIN_VALUE = -(1 << (8 * array("i").itemsize - 1))
+MAX_VALUE = (1 << (8 * array("i").itemsize - 1)) - 1
+
+CATEGORY_CODES = {
+    AGED_BRIE: AGED_BRIE_ITEM,
+    BACKSTAGE_PASSES: BACKSTAGE_PASS_ITEM,
+    SULFURAS: SULFURAS_ITEM,
+}
+
+
+def category_of(name):
+    """Return the category code for an item name.
+
+    Args:
+        name: Item name.
+
+    Returns:
+        One of the *_ITEM category codes.
+    """
+    return CATEGORY_CODES.get(name, NORMAL_ITEM)
+
+
+def _category_strategies():
+    """Map each category code to its GildedRose update method."""
+    rules = GildedRose([])
+    names = {code: name for name, code in CATEGORY_CODES.items()}
+    names[NORMAL_ITEM] = None  # any name without a special strategy
+    return {code: rules.strategy_for(name) for code, name in names.items()}
+
+
+_CATEGORY_STRATEGIES = _category_strategies()
+
+
+class ColumnarInventory:
+    """Inventory stored as contiguous columns instead of Item objects."""
+
+    def __init__(self, names, name_codes, sell_in, quality):
+        """Build an inventory directly from its columns.
+
+        Args:
+            names: Distinct item names; name_codes index into this list.
+            name_codes: Per-item index into names.
+            sell_in: Per-item sell_in values.
+            quality: Per-item quality values.
+        """
+        self.names = list(names)
+        self._name_codes = array("i", name_codes)
+        self._sell_in = array("i", sell_in)
+        self._quality = array("i", quality)
+        name_categories = [category_of(name) for name in self.names]
+        self._categories = array("b", (name_categories[code] for code in self._name_codes))
+
+    @classmethod
+    def from_items(cls, items):
+        """Build an inventory from Item objects.
+
+        Args:
+            items: Iterable of Item objects.
+
+        Returns:
+            ColumnarInventory with the items in the same order.
+        """
+        names = {}
+        name_codes, sell_in, quality = [], [], []
+        for item in items:
+            name_codes.append(names.setdefault(item.name, len(names)))
+            sell_in.append(item.sell_in)
+            quality.append(item.quality)
+        return cls(names, name_codes, sell_in, quality)
+
+    def to_items(self):
+        """Materialize the inventory as Item objects.
+
+        Returns:
+            List of new Item objects in inventory order.
+        """
+        names = self.names
+        return [
+            Item(names[code], sell_in, quality)
+            for code, sell_in, quality in zip(self._name_codes, self._sell_in, self._quality)
+        ]
+
+    def __len__(self):
+        return len(self._sell_in)
+
+    @property
+    def sell_in(self):
+        """Read-only view of the sell_in column (format "i")."""
+        return memoryview(self._sell_in).toreadonly()
+
+    @property
+    def quality(self):
+        """Read-only view of the quality column (format "i")."""
+        return memoryview(self._quality).toreadonly()
+
+    @property
+    def categories(self):
+        """Read-only view of the category code column (format "b")."""
+        return memoryview(self._categories).toreadonly()
+
+    @property
+    def name_codes(self):
+        """Read-only view of the dictionary-encoded name column (format "i")."""
+        return memoryview(self._name_codes).toreadonly()
+
+    def update_quality(self):
+        """Update quality and sell_in for all items in place."""
+        sell_in, quality = self._sell_in, self._quality
+        strategies = _CATEGORY_STRATEGIES
+        scratch = Item(None, 0, 0)
+        for index, category in enumerate(self._categories):
+            scratch.sell_in = sell_in[index]
+            scratch.quality = quality[index]
+            strategies[category](scratch)
+            sell_in[index] = scratch.sell_in
+            quality[index] = scratch.quality
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Inventory with lock-free snapshot reads during update_quality.
+
+GildedRose mutates its Items in place, so readers racing with an update can
+observe a half-updated day. ConcurrentInventory instead publishes each day
+as an immutable snapshot. The writer computes day N+1 on private copies and
+swaps the new snapshot in with a single reference assignment, which is
+atomic on both the GIL and free-threaded CPython builds. Readers never take
+a lock and always see one complete day.
+"""
+import collections
+import threading
+
+from gilded_rose import GildedRose, Item
+
+
+class ItemState(collections.namedtuple("ItemState", "name sell_in quality")):
+    """Immutable view of an item on a given day."""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        """Return string representation of the item state.
+
+        Returns:
+            String in format "name, sell_in, quality", as for Item.
+        """
+        return f"{self.name}, {self.sell_in}, {self.quality}"
+
+
+InventorySnapshot = collections.namedtuple("InventorySnapshot", "day items")
+
+
+class ConcurrentInventory:
+    """Publishes one consistent, immutable snapshot of the inventory per day."""
+
+    def __init__(self, items, day=0):
+        """Take the initial snapshot of the given items.
+
+        Args:
+            items: Iterable of Item objects; they are copied, not retained.
+            day: Day number of the initial snapshot.
+        """
+        self._writer_lock = threading.Lock()
+        self._snapshot = InventorySnapshot(
+            day, tuple(ItemState(item.name, item.sell_in, item.quality) for item in items)
+        )
+
+    def snapshot(self):
+        """Return the latest published day without blocking.
+
+        Returns:
+            InventorySnapshot holding the day number and a tuple of ItemStates.
+        """
+        return self._snapshot
+
+    def update_quality(self):
+        """Compute and publish the next day.
+
+        Concurrent writers are serialized; readers are never blocked.
+
+        Returns:
+            The newly published InventorySnapshot.
+        """
+        with self._writer_lock:
+            current = self._snapshot
+            items = [Item(*state) for state in current.items]
+            GildedRose(items).update_quality()
+            self._snapshot = InventorySnapshot(
+                current.day + 1,
+                tuple(ItemState(item.name, item.sell_in, item.quality) for item in items),
+            )
+            return self._snapshot
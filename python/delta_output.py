@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""Delta encoding for the TextTest fixture output.
+
+Day 0 is written in the classic format. Every later day only lists the
+items that broke their implied rule: each item is expected to repeat the
+(sell_in, quality) change it made the day before, starting from no change.
+Steady items such as Sulfuras, clamped items and items ageing at a constant
+rate therefore cost nothing after their first day.
+
+Delta lines have the form "index, sell_in, quality" where index is the
+item's position in the day 0 listing. decode() rebuilds the classic output
+byte for byte.
+"""
+import sys
+
+DAY_PREFIX = "-------- day "
+DAY_HEADER = DAY_PREFIX + "%s --------\n"
+COLUMN_HEADER = "name, sellIn, quality\n"
+
+
+def parse_item(line):
+    """Split a classic "name, sell_in, quality" line into its fields.
+
+    Names may themselves contain ", ", so the numbers are split from the right.
+
+    Args:
+        line: Item line, with or without its trailing newline.
+
+    Returns:
+        Tuple of (name, sell_in, quality).
+    """
+    name, sell_in, quality = line.rstrip("\n").rsplit(", ", 2)
+    return name, int(sell_in), int(quality)
+
+
+def render_day(day, items):
+    """Render one day in the classic fixture format.
+
+    Args:
+        day: Day number printed in the header.
+        items: Item objects to list.
+
+    Returns:
+        The text block for this day, including the trailing blank line.
+    """
+    lines = [DAY_HEADER % day, COLUMN_HEADER]
+    lines.extend("%r\n" % (item,) for item in items)
+    lines.append("\n")
+    return "".join(lines)
+
+
+class DeltaEncoder:
+    """Encodes successive days of an inventory as delta blocks."""
+
+    def __init__(self):
+        """Create an encoder that has not seen day 0 yet."""
+        self._state = None
+        self._step = None
+
+    def encode(self, day, items):
+        """Render one day of the fixture output.
+
+        Args:
+            day: Day number printed in the header.
+            items: Item objects in the same order every day.
+
+        Returns:
+            The text block for this day, including the trailing blank line.
+        """
+        state = [(item.sell_in, item.quality) for item in items]
+        if self._state is None:
+            self._step = [(0, 0)] * len(state)
+            self._state = state
+            return render_day(day, items)
+
+        lines = [DAY_HEADER % day]
+        step = []
+        for index, (current, previous, previous_step) in enumerate(
+            zip(state, self._state, self._step)
+        ):
+            change = (current[0] - previous[0], current[1] - previous[1])
+            if change != previous_step:
+                lines.append("%d, %d, %d\n" % (index, current[0], current[1]))
+            step.append(change)
+        lines.append("\n")
+        self._step = step
+        self._state = state
+        return "".join(lines)
+
+
+def decode(lines):
+    """Rebuild the classic fixture output from a delta-encoded stream.
+
+    Args:
+        lines: Iterable of delta-encoded lines, each ending in a newline.
+
+    Yields:
+        Lines of the classic output, each ending in a newline.
+    """
+    lines = iter(lines)
+    names = None
+    state = None
+    step = None
+
+    for line in lines:
+        if not line.startswith(DAY_PREFIX):
+            yield line
+            continue
+
+        yield line
+        if names is None:
+            yield next(lines)  # column header
+            names, state = [], []
+            for item_line in lines:
+                if item_line == "\n":
+                    break
+                name, sell_in, quality = parse_item(item_line)
+                names.append(name)
+                state.append((sell_in, quality))
+            step = [(0, 0)] * len(state)
+        else:
+            predicted = [
+                (sell_in + step_sell_in, quality + step_quality)
+                for (sell_in, quality), (step_sell_in, step_quality) in zip(state, step)
+            ]
+            for delta_line in lines:
+                if delta_line == "\n":
+                    break
+                index, sell_in, quality = (int(field) for field in delta_line.split(", "))
+                predicted[index] = (sell_in, quality)
+            step = [
+                (sell_in - old_sell_in, quality - old_quality)
+                for (sell_in, quality), (old_sell_in, old_quality) in zip(predicted, state)
+            ]
+            state = predicted
+            yield COLUMN_HEADER
+
+        for name, (sell_in, quality) in zip(names, state):
+            yield "%s, %d, %d\n" % (name, sell_in, quality)
+        yield "\n"
+
+
+if __name__ == "__main__":
+    sys.stdout.writelines(decode(sys.stdin))
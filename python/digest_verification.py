@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""Streaming digest verification for large fixture outputs.
+
+Instead of holding the whole fixture output in memory, DigestWriter hashes
+it line by line as it is written. For every day it records a digest of the
+day's block, a rolling digest of everything written so far, and one digest
+per chunk of item lines. Comparing these records with the approved ones
+localizes a regression to a day and an item range in constant memory.
+"""
+import collections
+import hashlib
+import json
+
+from delta_output import COLUMN_HEADER, DAY_PREFIX
+
+DEFAULT_CHUNK_SIZE = 1024
+
+DayDigest = collections.namedtuple("DayDigest", "day digest rolling chunks")
+
+
+class DigestMismatch(AssertionError):
+    """Raised when the fixture output differs from the approved digests."""
+
+    def __init__(self, message, day=None, item_range=None):
+        """Describe where the output diverged.
+
+        Args:
+            message: Human-readable description of the mismatch.
+            day: Day whose block differs, or whose preceding output differs.
+            item_range: (start, stop) item indices of the differing chunk,
+                or None if the difference is outside the item lines.
+        """
+        super().__init__(message)
+        self.day = day
+        self.item_range = item_range
+
+
+class DigestWriter:
+    """File-like text sink that hashes fixture output as it is written."""
+
+    def __init__(self, on_day=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Create a writer.
+
+        Args:
+            on_day: Callable receiving each completed DayDigest. When
+                omitted, digests are collected in the ``days`` list.
+            chunk_size: Number of item lines hashed per chunk digest.
+        """
+        self.days = []
+        self.chunk_size = chunk_size
+        self._on_day = on_day if on_day is not None else self.days.append
+        self._pending = ""
+        self._rolling = hashlib.sha256()
+        self._day = None
+        self._day_hash = None
+        self._chunk_hash = None
+        self._chunks = []
+        self._items = 0
+
+    def write(self, text):
+        """Hash the complete lines in text, buffering any partial line.
+
+        Args:
+            text: Output text as passed to a file's write().
+
+        Returns:
+            Number of characters written.
+        """
+        lines = (self._pending + text).split("\n")
+        self._pending = lines.pop()
+        for line in lines:
+            completed = self.feed_line(line + "\n")
+            if completed is not None:
+                self._on_day(completed)
+        return len(text)
+
+    def flush(self):
+        """Nothing to flush; present for file compatibility."""
+
+    def close(self):
+        """Hash any trailing partial line and finish the last day."""
+        if self._pending:
+            completed = self.feed_line(self._pending)
+            self._pending = ""
+            if completed is not None:
+                self._on_day(completed)
+        completed = self._finish_day()
+        if completed is not None:
+            self._on_day(completed)
+
+    def feed_line(self, line):
+        """Hash one line of output.
+
+        Args:
+            line: A single line, including its newline if it has one.
+
+        Returns:
+            The DayDigest of the previous day when line starts a new day,
+            otherwise None.
+        """
+        completed = None
+        if line.startswith(DAY_PREFIX):
+            completed = self._finish_day()
+            self._day = int(line[len(DAY_PREFIX):].split(" ", 1)[0])
+            self._day_hash = hashlib.sha256()
+            self._chunk_hash = hashlib.sha256()
+            self._chunks = []
+            self._items = 0
+
+        data = line.encode("utf-8")
+        self._rolling.update(data)
+        if self._day_hash is None:
+            return completed
+
+        self._day_hash.update(data)
+        if line.startswith(DAY_PREFIX) or line == COLUMN_HEADER or line == "\n":
+            return completed
+
+        self._chunk_hash.update(data)
+        self._items += 1
+        if self._items % self.chunk_size == 0:
+            self._chunks.append(self._chunk_hash.hexdigest())
+            self._chunk_hash = hashlib.sha256()
+        return completed
+
+    def _finish_day(self):
+        """Close the current day's digests.
+
+        Returns:
+            The DayDigest of the current day, or None before day 0.
+        """
+        if self._day_hash is None:
+            return None
+        if self._items % self.chunk_size:
+            self._chunks.append(self._chunk_hash.hexdigest())
+        completed = DayDigest(
+            self._day,
+            self._day_hash.hexdigest(),
+            self._rolling.hexdigest(),
+            tuple(self._chunks),
+        )
+        self._day_hash = None
+        return completed
+
+
+class DigestVerifier:
+    """Compares DayDigests one day at a time against approved ones."""
+
+    def __init__(self, expected, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Create a verifier.
+
+        Args:
+            expected: Iterable of approved DayDigests, consumed lazily.
+            chunk_size: Chunk size both digest streams were made with.
+        """
+        self.chunk_size = chunk_size
+        self._expected = iter(expected)
+
+    def __call__(self, actual):
+        """Check one completed day; usable as a DigestWriter ``on_day``.
+
+        Args:
+            actual: DayDigest computed from the output under test.
+
+        Raises:
+            DigestMismatch: If the day differs from the approved one.
+        """
+        expected = next(self._expected, None)
+        if expected is None:
+            raise DigestMismatch(f"unexpected extra day {actual.day}", actual.day)
+        if expected.day != actual.day:
+            raise DigestMismatch(
+                f"expected day {expected.day}, got day {actual.day}", expected.day
+            )
+        if expected.digest != actual.digest:
+            raise self._localize(expected, actual)
+        if expected.rolling != actual.rolling:
+            raise DigestMismatch(f"output before day {actual.day} differs", actual.day)
+
+    def finish(self):
+        """Check that no approved day is missing from the output.
+
+        Raises:
+            DigestMismatch: If approved days remain unverified.
+        """
+        expected = next(self._expected, None)
+        if expected is not None:
+            raise DigestMismatch(f"output ends before day {expected.day}", expected.day)
+
+    def _localize(self, expected, actual):
+        """Build the mismatch for a day whose block digest differs."""
+        for index, (want, got) in enumerate(zip(expected.chunks, actual.chunks)):
+            if want != got:
+                break
+        else:
+            index = min(len(expected.chunks), len(actual.chunks))
+            if len(expected.chunks) == len(actual.chunks):
+                return DigestMismatch(
+                    f"day {actual.day} differs outside its item lines", actual.day
+                )
+        item_range = (index * self.chunk_size, (index + 1) * self.chunk_size)
+        return DigestMismatch(
+            f"day {actual.day} differs in items {item_range[0]}..{item_range[1] - 1}",
+            actual.day,
+            item_range,
+        )
+
+
+def digest_lines(lines, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Digest already-rendered output, such as an approved file.
+
+    Args:
+        lines: Iterable of output lines, e.g. an open text file.
+        chunk_size: Number of item lines hashed per chunk digest.
+
+    Yields:
+        One DayDigest per day, as soon as the day is complete.
+    """
+    writer = DigestWriter(chunk_size=chunk_size)
+    for line in lines:
+        completed = writer.feed_line(line)
+        if completed is not None:
+            yield completed
+    completed = writer._finish_day()
+    if completed is not None:
+        yield completed
+
+
+def write_digests(days, stream):
+    """Store DayDigests as JSON lines so approved runs need not keep output.
+
+    Args:
+        days: Iterable of DayDigests.
+        stream: Text file to write to.
+    """
+    for day in days:
+        stream.write(json.dumps(day._asdict()) + "\n")
+
+
+def read_digests(stream):
+    """Load DayDigests written by write_digests.
+
+    Args:
+        stream: Text file to read from.
+
+    Yields:
+        DayDigests in file order.
+    """
+    for line in stream:
+        record = json.loads(line)
+        yield DayDigest(record["day"], record["digest"], record["rolling"], tuple(record["chunks"]))
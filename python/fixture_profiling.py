@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""Low-overhead profiling helpers for the TextTest fixture.
+
+SamplingProfiler periodically samples one thread's Python stack from a
+background thread and aggregates the samples in the collapsed-stack format
+read by flamegraph tools ("outer;inner;leaf count"). AllocationTracker uses
+tracemalloc to record the peak memory allocated during each named phase.
+"""
+import collections
+import contextlib
+import os
+import sys
+import threading
+import tracemalloc
+
+DEFAULT_INTERVAL = 0.001
+
+
+def _frame_label(frame):
+    """Describe a frame as "file.py:function" for a collapsed stack."""
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+class SamplingProfiler:
+    """Samples the stack of one thread at a fixed interval."""
+
+    def __init__(self, interval=DEFAULT_INTERVAL, thread_id=None):
+        """Create a profiler; call start() to begin sampling.
+
+        Args:
+            interval: Seconds between samples.
+            thread_id: Thread to sample; defaults to the calling thread.
+        """
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.samples = collections.Counter()
+        self._stopped = threading.Event()
+        self._sampler = None
+
+    def start(self):
+        """Start sampling in a background daemon thread."""
+        self._stopped.clear()
+        self._sampler = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._sampler.start()
+
+    def stop(self):
+        """Stop sampling and wait for the sampler thread to exit."""
+        self._stopped.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def write_collapsed(self, stream):
+        """Write the aggregated samples in collapsed-stack format.
+
+        Args:
+            stream: Text file to write to.
+        """
+        for stack, count in sorted(self.samples.items()):
+            stream.write(f"{';'.join(stack)} {count}\n")
+
+    def _run(self):
+        """Sampler loop: record the target thread's stack until stopped."""
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            self.samples[tuple(reversed(stack))] += 1
+
+
+class AllocationTracker:
+    """Records the peak traced allocation of each named phase."""
+
+    def __init__(self):
+        """Create a tracker; call start() to begin tracing."""
+        self.peaks = {}
+
+    def start(self):
+        """Start tracemalloc tracing."""
+        tracemalloc.start()
+
+    def stop(self):
+        """Stop tracemalloc tracing and free its traces."""
+        tracemalloc.stop()
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Measure the peak allocation above the phase's starting point.
+
+        A phase entered several times keeps its largest peak.
+
+        Args:
+            name: Phase name used in the report.
+        """
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        try:
+            yield
+        finally:
+            peak = tracemalloc.get_traced_memory()[1] - baseline
+            self.peaks[name] = max(self.peaks.get(name, 0), peak)
+
+    def report(self, stream):
+        """Write one "phase: peak bytes" line per phase.
+
+        Args:
+            stream: Text file to write to.
+        """
+        for name, peak in self.peaks.items():
+            stream.write(f"{name}: peak {peak} bytes\n")
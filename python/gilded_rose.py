@@ -46,9 +46,20 @@ class GildedRose:
     def update_quality(self):
         """Update quality and sell_in for all items according to business rules."""
         for item in self.items:
-            strategy = self.update_strategies.get(item.name, self._update_normal_item)
+            strategy = self.strategy_for(item.name)
             strategy(item)
 
+    def strategy_for(self, name):
+        """Look up the update method for an item name.
+        
+        Args:
+            name: Name of the item.
+            
+        Returns:
+            Method that applies one day's update to an item of that name.
+        """
+        return self.update_strategies.get(name, self._update_normal_item)
+
     def _update_normal_item(self, item):
         """Update quality for normal items.
         
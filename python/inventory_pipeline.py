@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""Overlapped read/update/write pipeline for inventory files.
+
+Inventory files hold one "name, sell_in, quality" line per item, the same
+format the TextTest fixture prints. roll_over_file() splits the work into
+three stages connected by bounded queues: a reader thread only reads chunks
+of raw lines, the calling thread parses them, applies update_quality and
+serializes the result, and a writer thread only writes the finished text.
+
+All the Python-level work stays in one thread, because threads running
+Python code would just take turns on the GIL. What overlaps is file I/O,
+which releases the GIL: while a chunk is parsed and updated, the next one is
+being read and the previous one written. On slow storage the total time
+then approaches that of the slowest stage; on files already in the page
+cache there is little I/O left to hide. The queues hold at most ``depth``
+chunks each, so a fast stage waits for a slow one instead of buffering the
+whole file.
+"""
+import itertools
+import queue
+import threading
+
+from delta_output import parse_item
+from gilded_rose import GildedRose, Item
+
+DEFAULT_CHUNK_SIZE = 10000
+DEFAULT_DEPTH = 2
+
+_DONE = object()
+
+
+class _Stopped(Exception):
+    """Raised inside a stage when another stage has failed."""
+
+
+def _put(channel, value, stop):
+    """Put value on a bounded queue, giving up if the pipeline stops."""
+    while True:
+        if stop.is_set():
+            raise _Stopped()
+        try:
+            channel.put(value, timeout=0.1)
+            return
+        except queue.Full:
+            pass
+
+
+def _get(channel, stop):
+    """Get a value from a queue, giving up if the pipeline stops."""
+    while True:
+        if stop.is_set():
+            raise _Stopped()
+        try:
+            return channel.get(timeout=0.1)
+        except queue.Empty:
+            pass
+
+
+def roll_over_lines(lines, days=1):
+    """Parse item lines, advance the items and serialize them again.
+
+    Args:
+        lines: Item lines, each ending in a newline.
+        days: Number of update_quality calls applied to each item.
+
+    Returns:
+        The updated item lines as one string.
+    """
+    items = [Item(*parse_item(line)) for line in lines]
+    gilded_rose = GildedRose(items)
+    for _ in range(days):
+        gilded_rose.update_quality()
+    return "".join("%r\n" % (item,) for item in items)
+
+
+def roll_over_file(source, destination, days=1, chunk_size=DEFAULT_CHUNK_SIZE, depth=DEFAULT_DEPTH):
+    """Advance every item in an inventory file and write the result.
+
+    Args:
+        source: Readable text file of item lines.
+        destination: Writable text file for the updated item lines.
+        days: Number of update_quality calls applied to each item.
+        chunk_size: Number of items per chunk.
+        depth: Maximum number of chunks queued between two stages.
+
+    Returns:
+        Number of items processed.
+
+    Raises:
+        Whatever the first failing stage raised, e.g. ValueError for a
+        malformed line.
+    """
+    lines = queue.Queue(maxsize=depth)
+    rendered = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    errors = []
+
+    def read():
+        try:
+            while True:
+                chunk = list(itertools.islice(source, chunk_size))
+                if not chunk:
+                    break
+                _put(lines, chunk, stop)
+            _put(lines, _DONE, stop)
+        except _Stopped:
+            pass
+        except BaseException as error:
+            errors.append(error)
+            stop.set()
+
+    def write():
+        try:
+            while True:
+                text = _get(rendered, stop)
+                if text is _DONE:
+                    return
+                destination.write(text)
+        except _Stopped:
+            pass
+        except BaseException as error:
+            errors.append(error)
+            stop.set()
+
+    reader = threading.Thread(target=read, name="inventory-reader", daemon=True)
+    writer = threading.Thread(target=write, name="inventory-writer", daemon=True)
+    reader.start()
+    writer.start()
+
+    count = 0
+    try:
+        while True:
+            chunk = _get(lines, stop)
+            if chunk is _DONE:
+                _put(rendered, _DONE, stop)
+                break
+            _put(rendered, roll_over_lines(chunk, days), stop)
+            count += len(chunk)
+    except _Stopped:
+        pass
+    except BaseException:
+        stop.set()
+        raise
+    finally:
+        reader.join()
+        writer.join()
+
+    if errors:
+        raise errors[0]
+    return count
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""Partitioned rollover across worker processes over TCP.
+
+A Coordinator splits the inventory into contiguous partitions and sends each
+one to a worker, which runs update_quality for the requested number of days
+and sends the partition back. Messages are newline-delimited JSON:
+
+    request:   {"partition": 3, "days": 30, "heartbeat": 10.0, "items": [[name, sell_in, quality], ...]}
+    heartbeat: {"partition": 3, "heartbeat": true}
+    response:  {"partition": 3, "items": [[name, sell_in, quality], ...]}
+
+While it computes, a worker sends a heartbeat at the requested interval, so
+the coordinator's timeout bounds the silence between messages rather than
+the length of the rollover: a long multi-day advance on a live worker never
+times out. A worker whose coordinator has gone away stops computing.
+
+If a worker cannot be reached, drops the connection, stays silent for the
+timeout or answers with a malformed response, its partition is reassigned
+to the next worker; a restarted worker is picked up again on its old
+address. Partitions are merged back in order, so the result is identical
+to a single-process run.
+
+Run a worker with:
+
+    python partitioned_rollover.py --host 127.0.0.1 --port 8765
+"""
+import argparse
+import concurrent.futures
+import json
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+
+from gilded_rose import GildedRose, Item
+
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_ROUNDS = 3
+RETRY_DELAY = 0.2
+HEARTBEATS_PER_TIMEOUT = 4
+
+
+def _encode_items(items):
+    return [[item.name, item.sell_in, item.quality] for item in items]
+
+
+def _decode_items(rows):
+    return [Item(*row) for row in rows]
+
+
+class _WorkerHandler(socketserver.StreamRequestHandler):
+    """Serves partition requests on one coordinator connection."""
+
+    def setup(self):
+        super().setup()
+        self._write_lock = threading.Lock()
+
+    def _send(self, message):
+        """Write one message; heartbeats and responses come from different threads."""
+        with self._write_lock:
+            self.wfile.write(json.dumps(message).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+    def _heartbeat(self, number, interval, done, abandoned):
+        """Send heartbeats until done is set, or flag the coordinator as gone."""
+        while not done.wait(interval):
+            try:
+                self._send({"partition": number, "heartbeat": True})
+            except OSError:
+                abandoned.set()
+                return
+
+    def handle(self):
+        for line in self.rfile:
+            request = json.loads(line)
+            number = request["partition"]
+            items = _decode_items(request["items"])
+            done, abandoned = threading.Event(), threading.Event()
+            heartbeat = None
+            if request.get("heartbeat"):
+                heartbeat = threading.Thread(
+                    target=self._heartbeat,
+                    args=(number, request["heartbeat"], done, abandoned),
+                    daemon=True,
+                )
+                heartbeat.start()
+            try:
+                gilded_rose = GildedRose(items)
+                for _ in range(request["days"]):
+                    if abandoned.is_set():
+                        return
+                    gilded_rose.update_quality()
+            finally:
+                done.set()
+                if heartbeat is not None:
+                    heartbeat.join()
+            self._send({"partition": number, "items": _encode_items(items)})
+
+
+class WorkerServer(socketserver.ThreadingTCPServer):
+    """TCP server that applies rollovers to the partitions it receives."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, address=("127.0.0.1", 0)):
+        """Bind the worker; call serve_forever() to start serving.
+
+        Args:
+            address: (host, port) to listen on; port 0 picks a free port.
+        """
+        super().__init__(address, _WorkerHandler)
+
+
+def spawn_worker(host="127.0.0.1", port=0):
+    """Start a worker in a separate process.
+
+    Args:
+        host: Interface the worker listens on.
+        port: Port to listen on; 0 lets the worker pick a free port.
+
+    Returns:
+        Tuple of (subprocess.Popen, (host, port)) for the running worker.
+    """
+    process = subprocess.Popen(
+        [sys.executable, __file__, "--host", host, "--port", str(port)],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    address = json.loads(process.stdout.readline())
+    return process, (address[0], address[1])
+
+
+def partition(items, count):
+    """Split items into at most count contiguous, near-equal partitions.
+
+    Args:
+        items: List of items.
+        count: Number of partitions wanted.
+
+    Returns:
+        List of non-empty lists, in item order.
+    """
+    size, extra = divmod(len(items), count)
+    partitions, start = [], 0
+    for index in range(count):
+        stop = start + size + (1 if index < extra else 0)
+        if stop > start:
+            partitions.append(items[start:stop])
+        start = stop
+    return partitions
+
+
+class Coordinator:
+    """Assigns inventory partitions to workers and merges the results."""
+
+    def __init__(self, workers, timeout=DEFAULT_TIMEOUT, rounds=DEFAULT_ROUNDS):
+        """Create a coordinator for a fixed set of worker addresses.
+
+        Args:
+            workers: List of (host, port) worker addresses.
+            timeout: Seconds to wait for a connection, or for the next
+                message from a connected worker, before giving up on it.
+                Workers send heartbeats while they compute, so this does
+                not limit how long a rollover may take.
+            rounds: Times every worker is tried for a partition before
+                the rollover fails.
+        """
+        if not workers:
+            raise ValueError("a coordinator needs at least one worker")
+        self.workers = list(workers)
+        self.timeout = timeout
+        self.rounds = rounds
+
+    def roll_over(self, items, days=1, partitions=None):
+        """Advance items by the given number of days on the workers.
+
+        Args:
+            items: List of Item objects; they are not modified.
+            days: Number of update_quality calls per item.
+            partitions: Number of partitions; defaults to one per worker.
+
+        Returns:
+            New list of Item objects in the original order.
+
+        Raises:
+            ConnectionError: If a partition could not be processed by any
+                worker.
+        """
+        chunks = partition(items, partitions or len(self.workers))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(len(chunks), 1)) as pool:
+            results = pool.map(
+                lambda numbered: self._process(numbered[0], numbered[1], days),
+                enumerate(chunks),
+            )
+            return [item for chunk in results for item in chunk]
+
+    def _process(self, number, chunk, days):
+        """Run one partition, moving on to the next worker on failure."""
+        request = json.dumps({
+            "partition": number,
+            "days": days,
+            "heartbeat": self.timeout / HEARTBEATS_PER_TIMEOUT,
+            "items": _encode_items(chunk),
+        })
+        attempts = len(self.workers) * self.rounds
+        last_error = None
+        for attempt in range(attempts):
+            worker = self.workers[(number + attempt) % len(self.workers)]
+            if attempt and attempt % len(self.workers) == 0:
+                time.sleep(RETRY_DELAY)  # give restarting workers a moment
+            try:
+                return self._send(worker, request, number)
+            except (OSError, ValueError, KeyError, TypeError) as error:
+                last_error = error
+        raise ConnectionError(f"partition {number} failed on every worker") from last_error
+
+    def _send(self, worker, request, number):
+        """Send one partition to a worker and wait for its items.
+
+        Each read waits at most self.timeout, which heartbeats reset.
+        """
+        with socket.create_connection(worker, timeout=self.timeout) as connection:
+            connection.sendall(request.encode("utf-8") + b"\n")
+            with connection.makefile("rb") as reply:
+                for line in reply:
+                    response = json.loads(line)
+                    if not isinstance(response, dict):
+                        raise ValueError(f"worker {worker} sent a malformed response")
+                    if response["partition"] != number:
+                        raise ValueError(
+                            f"worker {worker} answered for partition {response['partition']}"
+                        )
+                    if not response.get("heartbeat"):
+                        return _decode_items(response["items"])
+        raise ConnectionError(f"worker {worker} closed the connection")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a Gilded Rose rollover worker.")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to listen on")
+    parser.add_argument("--port", type=int, default=0, help="port to listen on (0 picks a free one)")
+    args = parser.parse_args(argv)
+
+    with WorkerServer((args.host, args.port)) as server:
+        print(json.dumps(list(server.server_address[:2])), flush=True)
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""Checkpoint and resume for long multi-day projections.
+
+run_projection() writes the same day-by-day listing as the TextTest fixture
+to an output file. Every ``interval`` days it records the inventory, the
+next day to render and the size of the output written so far in a
+checkpoint file, replaced atomically. After a crash, resume_projection()
+truncates the output back to the checkpointed size and continues from
+there, so the finished file is identical to an uninterrupted run.
+
+A shorter interval loses less work on a crash but pays for more
+checkpoints; each one costs a JSON dump of the inventory and three fsyncs:
+the output, the checkpoint and the directory holding the checkpoint.
+"""
+import argparse
+import json
+import os
+
+from delta_output import parse_item, render_day
+from gilded_rose import GildedRose, Item
+
+DEFAULT_INTERVAL = 30
+
+
+def _fsync_directory(path):
+    """Flush the directory holding path, so a rename in it survives a crash."""
+    if os.name == "nt":
+        return  # Windows cannot open a directory for fsync
+    descriptor = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+def _write_checkpoint(path, state):
+    """Atomically replace the checkpoint file with state."""
+    temporary = path + ".tmp"
+    with open(temporary, "w", encoding="utf-8") as checkpoint:
+        json.dump(state, checkpoint)
+        checkpoint.flush()
+        os.fsync(checkpoint.fileno())
+    os.replace(temporary, path)
+    _fsync_directory(path)
+
+
+def _project(items, first_day, last_day, output, checkpoint_path, interval):
+    """Render and advance days first_day..last_day, checkpointing as it goes."""
+    gilded_rose = GildedRose(items)
+    for day in range(first_day, last_day + 1):
+        output.write(render_day(day, items).encode("utf-8"))
+        gilded_rose.update_quality()
+        if interval and (day + 1) % interval == 0 and day < last_day:
+            output.flush()
+            os.fsync(output.fileno())
+            _write_checkpoint(checkpoint_path, {
+                "next_day": day + 1,
+                "last_day": last_day,
+                "interval": interval,
+                "output_size": output.tell(),
+                "items": [[item.name, item.sell_in, item.quality] for item in items],
+            })
+    output.flush()
+    os.fsync(output.fileno())
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+
+def run_projection(items, days, output_path, checkpoint_path, interval=DEFAULT_INTERVAL):
+    """Project an inventory over several days, writing periodic checkpoints.
+
+    Args:
+        items: List of Item objects; they are updated in place.
+        days: Number of days after day 0, as for texttest_fixture.py.
+        output_path: File receiving the fixture-format listing.
+        checkpoint_path: File holding the latest checkpoint. It is removed
+            once the projection completes.
+        interval: Days between checkpoints; 0 disables checkpointing.
+    """
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)  # left over from an earlier projection
+    with open(output_path, "wb") as output:
+        output.write(b"OMGHAI!\n")
+        _project(items, 0, days, output, checkpoint_path, interval)
+
+
+def resume_projection(output_path, checkpoint_path, interval=None):
+    """Continue a projection from its last checkpoint.
+
+    Args:
+        output_path: Output file of the interrupted projection.
+        checkpoint_path: Checkpoint file written by run_projection.
+        interval: Days between further checkpoints; defaults to the
+            interval the projection was started with.
+
+    Returns:
+        The inventory after the last day, as a list of Items.
+
+    Raises:
+        FileNotFoundError: If there is no checkpoint to resume from.
+    """
+    with open(checkpoint_path, encoding="utf-8") as checkpoint:
+        state = json.load(checkpoint)
+    items = [Item(*fields) for fields in state["items"]]
+    with open(output_path, "r+b") as output:
+        output.truncate(state["output_size"])
+        output.seek(state["output_size"])
+        _project(
+            items,
+            state["next_day"],
+            state["last_day"],
+            output,
+            checkpoint_path,
+            state["interval"] if interval is None else interval,
+        )
+    return items
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Project an inventory file over many days with checkpoints.")
+    parser.add_argument("inventory", nargs="?",
+                        help="file with one 'name, sell_in, quality' line per item (not used with --resume)")
+    parser.add_argument("output", nargs="?", help="file receiving the day-by-day listing")
+    parser.add_argument("--days", type=int, default=365, help="number of days after day 0")
+    parser.add_argument("--checkpoint", help="checkpoint file (default: OUTPUT.checkpoint)")
+    parser.add_argument("--interval", type=int,
+                        help="days between checkpoints (default: %d, or the interval being resumed)" % DEFAULT_INTERVAL)
+    parser.add_argument("--resume", action="store_true", help="continue from the last checkpoint")
+    args = parser.parse_args(argv)
+    if args.resume:
+        if args.output is None:
+            args.inventory, args.output = None, args.inventory
+        else:
+            parser.error("--resume takes only the output file")
+        if args.output is None:
+            parser.error("the output file is required")
+    elif args.output is None:
+        parser.error("the inventory and output files are required")
+
+    checkpoint_path = args.checkpoint or args.output + ".checkpoint"
+    if args.resume:
+        resume_projection(args.output, checkpoint_path, args.interval)
+        return
+    with open(args.inventory, encoding="utf-8") as inventory:
+        items = [Item(*parse_item(line)) for line in inventory if line.strip()]
+    interval = DEFAULT_INTERVAL if args.interval is None else args.interval
+    run_projection(items, args.days, args.output, checkpoint_path, interval)
+
+
+if __name__ == "__main__":
+    main()
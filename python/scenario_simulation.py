@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""Batched what-if simulation over many starting scenarios.
+
+A slot is one item name with many starting (sell_in, quality) states, its
+scenarios. Items never interact, so every slot is simulated on its own and
+slots may hold different numbers of scenarios. Within a slot, scenarios are
+grouped by sell_in: every scenario in a group gets the same quality step
+each day, and all groups age in step, so a day applies one comprehension
+per group instead of a GildedRose method call per item. Per-slot statistics
+are reported for each day instead of keeping any intermediate Item.
+
+The category kernels below restate the GildedRose rules, so any rule change
+(for example Conjured items) must be made here as well. The parity tests in
+tests/test_scenario_simulation.py catch any drift.
+
+Starting states for a slot come from grid() for every combination of the
+given values, or from sample() for random draws:
+
+    passes = grid(BACKSTAGE_PASSES, range(5, 21), range(10, 50))
+    for day in simulate([passes], 30):
+        print(day.day, day.slots[0].mean_quality)
+"""
+import collections
+import itertools
+import random
+
+from columnar_inventory import (
+    AGED_BRIE_ITEM,
+    BACKSTAGE_PASS_ITEM,
+    NORMAL_ITEM,
+    SULFURAS_ITEM,
+    category_of,
+)
+from gilded_rose import MAX_QUALITY, MIN_QUALITY
+
+SlotStatistics = collections.namedtuple(
+    "SlotStatistics", "name mean_quality min_quality max_quality worthless expired"
+)
+DayStatistics = collections.namedtuple("DayStatistics", "day slots")
+
+
+def grid(name, sell_in_values, quality_values):
+    """Build starting states for every (sell_in, quality) combination.
+
+    Args:
+        name: Item name shared by all states.
+        sell_in_values: Iterable of starting sell_in values.
+        quality_values: Iterable of starting quality values.
+
+    Returns:
+        List of (name, sell_in, quality) tuples, one per scenario.
+    """
+    return [(name, sell_in, quality)
+            for sell_in, quality in itertools.product(sell_in_values, list(quality_values))]
+
+
+def sample(name, sell_in, quality, count, seed=None):
+    """Draw starting states from distributions.
+
+    Args:
+        name: Item name shared by all states.
+        sell_in: Callable taking a random.Random and returning a sell_in.
+        quality: Callable taking a random.Random and returning a quality.
+        count: Number of scenarios to draw.
+        seed: Seed for reproducible draws.
+
+    Returns:
+        List of (name, sell_in, quality) tuples, one per scenario.
+    """
+    rng = random.Random(seed)
+    return [(name, sell_in(rng), quality(rng)) for _ in range(count)]
+
+
+def _raise(quality, step):
+    """Raise a quality column by step, stopping at MAX_QUALITY."""
+    limit = MAX_QUALITY - step
+    return [value + step if value <= limit else MAX_QUALITY if value < MAX_QUALITY else value
+            for value in quality]
+
+
+def _lower(quality, step):
+    """Lower a quality column by step, stopping at MIN_QUALITY."""
+    limit = MIN_QUALITY + step
+    return [value - step if value >= limit else MIN_QUALITY if value > MIN_QUALITY else value
+            for value in quality]
+
+
+def _advance_normal(sell_in, quality):
+    """Normal items lose 1 quality a day, 2 once expired."""
+    return sell_in - 1, _lower(quality, 1 if sell_in > 0 else 2)
+
+
+def _advance_aged_brie(sell_in, quality):
+    """Aged Brie gains 1 quality a day, 2 once expired."""
+    return sell_in - 1, _raise(quality, 1 if sell_in > 0 else 2)
+
+
+def _advance_backstage_pass(sell_in, quality):
+    """Passes gain 1, 2 or 3 quality as the concert nears, and drop to 0 after it."""
+    if sell_in <= 0:
+        return sell_in - 1, [MIN_QUALITY] * len(quality)
+    return sell_in - 1, _raise(quality, 3 if sell_in < 6 else 2 if sell_in < 11 else 1)
+
+
+def _advance_sulfuras(sell_in, quality):
+    """Sulfuras never changes."""
+    return sell_in, quality
+
+
+_KERNELS = {
+    NORMAL_ITEM: _advance_normal,
+    AGED_BRIE_ITEM: _advance_aged_brie,
+    BACKSTAGE_PASS_ITEM: _advance_backstage_pass,
+    SULFURAS_ITEM: _advance_sulfuras,
+}
+
+
+def _statistics(name, groups):
+    """Summarize one slot's {sell_in: quality column} groups."""
+    columns = groups.values()
+    return SlotStatistics(
+        name,
+        sum(map(sum, columns)) / sum(map(len, columns)),
+        min(map(min, columns)),
+        max(map(max, columns)),
+        sum(column.count(0) for column in columns),
+        sum(len(column) for sell_in, column in groups.items() if sell_in < 0),
+    )
+
+
+def simulate(slots, days):
+    """Advance every scenario of every slot and summarize each day.
+
+    Args:
+        slots: List of slots; each slot is a non-empty list of (name,
+            sell_in, quality) starting states, one per scenario, that all
+            share one name. Slots may differ in length.
+        days: Number of days to simulate after day 0.
+
+    Returns:
+        List of DayStatistics for days 0..days.
+
+    Raises:
+        ValueError: If a slot is empty or mixes item names.
+    """
+    slots_by_group = []
+    for states in slots:
+        if not states:
+            raise ValueError("every slot needs at least one scenario")
+        name = states[0][0]
+        if any(state_name != name for state_name, _, _ in states):
+            raise ValueError("every scenario of a slot must have the same item name")
+        groups = collections.defaultdict(list)
+        for _, sell_in, quality in states:
+            groups[sell_in].append(quality)
+        slots_by_group.append((name, _KERNELS[category_of(name)], dict(groups)))
+
+    statistics = []
+    for day in range(days + 1):
+        if day:
+            slots_by_group = [
+                (name, kernel, dict(kernel(sell_in, quality) for sell_in, quality in groups.items()))
+                for name, kernel, groups in slots_by_group
+            ]
+        statistics.append(DayStatistics(day, [
+            _statistics(name, groups) for name, _, groups in slots_by_group
+        ]))
+    return statistics
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""SQLite-backed persistent inventory for the Gilded Rose.
+
+Items live in a local SQLite database so the inventory survives restarts.
+The daily rollover is applied as one set-based UPDATE per item category
+instead of loading every Item into Python and writing it back.
+
+The statements below restate the GildedRose rules in SQL, so any rule
+change (for example Conjured items) must be made here as well. The parity
+tests in tests/test_sqlite_inventory.py and validate=True catch any drift.
+"""
+import sqlite3
+
+from gilded_rose import (
+    AGED_BRIE,
+    BACKSTAGE_PASSES,
+    MAX_QUALITY,
+    MIN_QUALITY,
+    SULFURAS,
+    GildedRose,
+    Item,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    sell_in INTEGER NOT NULL,
+    quality INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_name ON items (name);
+"""
+
+# Each statement mirrors one GildedRose strategy. SQLite evaluates every
+# SET expression against the row's old values, so "sell_in" inside the
+# quality expressions is the sell_in before the rollover.
+_ROLLOVER_STATEMENTS = (
+    # Normal items: -1 before the sell date, -2 after, never below MIN_QUALITY.
+    (
+        "UPDATE items SET"
+        " quality = CASE WHEN quality > :min_quality"
+        " THEN MAX(:min_quality, quality - CASE WHEN sell_in <= 0 THEN 2 ELSE 1 END)"
+        " ELSE quality END,"
+        " sell_in = sell_in - 1"
+        " WHERE name NOT IN (:aged_brie, :backstage_passes, :sulfuras)"
+    ),
+    # Aged Brie: +1 before the sell date, +2 after, never above MAX_QUALITY.
+    (
+        "UPDATE items SET"
+        " quality = CASE WHEN quality < :max_quality"
+        " THEN MIN(:max_quality, quality + CASE WHEN sell_in <= 0 THEN 2 ELSE 1 END)"
+        " ELSE quality END,"
+        " sell_in = sell_in - 1"
+        " WHERE name = :aged_brie"
+    ),
+    # Backstage passes: +1, +2 within 10 days, +3 within 5 days, 0 after.
+    (
+        "UPDATE items SET"
+        " quality = CASE WHEN sell_in <= 0 THEN :min_quality"
+        " WHEN quality < :max_quality"
+        " THEN MIN(:max_quality, quality + 1 + (sell_in < 11) + (sell_in < 6))"
+        " ELSE quality END,"
+        " sell_in = sell_in - 1"
+        " WHERE name = :backstage_passes"
+    ),
+    # Sulfuras never changes, so it needs no statement.
+)
+
+_RULE_PARAMETERS = {
+    "aged_brie": AGED_BRIE,
+    "backstage_passes": BACKSTAGE_PASSES,
+    "sulfuras": SULFURAS,
+    "min_quality": MIN_QUALITY,
+    "max_quality": MAX_QUALITY,
+}
+
+
+class SqliteInventory:
+    """Persistent inventory whose daily rollover runs inside SQLite.
+
+    In validation mode every rollover is also replayed on the in-memory
+    GildedRose and the two results are compared row by row.
+    """
+
+    def __init__(self, path=":memory:", validate=False):
+        """Open (or create) the inventory database.
+
+        Args:
+            path: SQLite database file, or ":memory:" for a transient one.
+            validate: If True, check every rollover against GildedRose.
+        """
+        self.validate = validate
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(_SCHEMA)
+
+    def add_items(self, items):
+        """Store items at the end of the inventory.
+
+        Args:
+            items: Iterable of Item objects to persist.
+        """
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO items (name, sell_in, quality) VALUES (?, ?, ?)",
+                ((item.name, item.sell_in, item.quality) for item in items),
+            )
+
+    def items(self):
+        """Load the stored inventory.
+
+        Returns:
+            List of Item objects in insertion order.
+        """
+        return [Item(*row) for row in self._rows()]
+
+    def update_quality(self):
+        """Apply one day's rollover to every stored item.
+
+        The statements and the validation check share one transaction, so
+        a rollover that fails validation leaves the stored inventory as it was.
+
+        Raises:
+            RuntimeError: In validation mode, if the database disagrees
+                with GildedRose on any item.
+        """
+        expected = self._expected_rollover() if self.validate else None
+
+        with self._connection:
+            for statement in _ROLLOVER_STATEMENTS:
+                self._connection.execute(statement, _RULE_PARAMETERS)
+            if expected is not None:
+                self._check_rollover(expected)
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _rows(self):
+        """Fetch (name, sell_in, quality) rows in insertion order."""
+        return self._connection.execute(
+            "SELECT name, sell_in, quality FROM items ORDER BY id"
+        ).fetchall()
+
+    def _expected_rollover(self):
+        """Compute the next day's rows with the in-memory GildedRose.
+
+        Returns:
+            List of (name, sell_in, quality) tuples in insertion order.
+        """
+        items = self.items()
+        GildedRose(items).update_quality()
+        return [(item.name, item.sell_in, item.quality) for item in items]
+
+    def _check_rollover(self, expected):
+        """Compare the stored rows with the in-memory rollover result.
+
+        Args:
+            expected: Rows produced by _expected_rollover.
+
+        Raises:
+            RuntimeError: If the row count or any row differs.
+        """
+        actual = self._rows()
+        if len(actual) != len(expected):
+            raise RuntimeError(
+                f"SQLite rollover has {len(actual)} items, expected {len(expected)}"
+            )
+        for position, (want, got) in enumerate(zip(expected, actual)):
+            if want != got:
+                raise RuntimeError(
+                    f"SQLite rollover diverged at item {position}: "
+                    f"expected {want}, got {got}"
+                )
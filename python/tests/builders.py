@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""Inventory builders and fixture runner shared by the tests."""
+import io
+import random
+import sys
+
+from delta_output import parse_item
+from gilded_rose import AGED_BRIE, BACKSTAGE_PASSES, SULFURAS, Item
+from texttest_fixture import main
+
+NAMES = ["Normal Item", AGED_BRIE, BACKSTAGE_PASSES, SULFURAS]
+
+
+def random_inventory(size, seed):
+    """Build a reproducible random inventory with every item category."""
+    rng = random.Random(seed)
+    return [Item(rng.choice(NAMES), rng.randint(-5, 20), rng.randint(0, 50)) for _ in range(size)]
+
+
+def edge_case_items():
+    """Items covering every category around its thresholds and clamps."""
+    return [
+        Item(name, sell_in, quality)
+        for name in NAMES
+        for sell_in in (-2, -1, 0, 1, 5, 6, 10, 11, 15)
+        for quality in (-1, 0, 1, 2, 47, 48, 49, 50, 51, 80)
+    ]
+
+
+def run_fixture(*args):
+    """Run the TextTest fixture, returning what it printed on stdout and stderr."""
+    orig = sys.stdout, sys.stderr, sys.argv
+    try:
+        sys.stdout, sys.stderr = io.StringIO(), io.StringIO()
+        sys.argv = ["texttest_fixture.py", *args]
+        main()
+        return sys.stdout.getvalue(), sys.stderr.getvalue()
+    finally:
+        sys.stdout, sys.stderr, sys.argv = orig
+
+
+def fixture_items():
+    """The inventory texttest_fixture.py starts from, read back from its day 0."""
+    lines = run_fixture(0)[0].splitlines()[3:-1]
+    return [Item(*parse_item(line)) for line in lines]
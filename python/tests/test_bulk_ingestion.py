@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""Tests for bulk ingestion and validation of inventory feeds."""
+import io
+import unittest
+
+import bulk_ingestion
+from benchmarks import ingest_per_item, ingestion_feed
+from bulk_ingestion import Rejection, ingest_columns, ingest_file, ingest_rows
+from gilded_rose import AGED_BRIE, SULFURAS
+
+
+class BulkIngestionTest(unittest.TestCase):
+    """Test suite for ingest_columns, ingest_rows and ingest_file."""
+
+    def test_valid_rows_build_the_inventory(self):
+        """Accepted rows keep their order and are normalized."""
+        result = ingest_rows([
+            ("  Aged Brie ", "2", "0"),
+            ("Sulfuras, Hand of Ragnaros", 0, 80),
+            ("Normal Item", -1, 50),
+        ])
+        self.assertEqual([], result.rejected)
+        self.assertEqual(
+            ["Aged Brie, 2, 0", "Sulfuras, Hand of Ragnaros, 0, 80", "Normal Item, -1, 50"],
+            [repr(item) for item in result.inventory.to_items()],
+        )
+
+    def test_invalid_rows_are_reported_in_bulk(self):
+        """Every bad row is rejected with the first rule it broke."""
+        result = ingest_rows([
+            ("Normal Item", 5, 51),
+            ("Aged Brie", 5, -1),
+            ("Sulfuras, Hand of Ragnaros", 0, 50),
+            ("", 5, 5),
+            ("Normal Item", "soon", 5),
+            ("Normal Item", 5),
+            ("Backstage passes to a TAFKAL80ETC concert", 10, 49),
+        ])
+        self.assertEqual(
+            [
+                Rejection(0, "quality above 50"),
+                Rejection(1, "quality below 0"),
+                Rejection(2, "Sulfuras quality is not 80"),
+                Rejection(3, "missing name"),
+                Rejection(4, "sell_in is not an integer"),
+                Rejection(5, "expected name, sell_in and quality"),
+            ],
+            result.rejected,
+        )
+        self.assertEqual(
+            ["Backstage passes to a TAFKAL80ETC concert, 10, 49"],
+            [repr(item) for item in result.inventory.to_items()],
+        )
+
+    def test_columns(self):
+        """Column input is validated the same way as rows."""
+        result = ingest_columns(["Aged Brie", "Aged Brie"], [1, 2], [10, 99])
+        self.assertEqual([Rejection(1, "quality above 50")], result.rejected)
+        self.assertEqual(["Aged Brie"], result.inventory.names)
+        self.assertEqual([10], result.inventory.quality.tolist())
+
+    def test_columns_must_have_same_length(self):
+        """Mismatched columns are a caller error."""
+        with self.assertRaises(ValueError):
+            ingest_columns(["Aged Brie"], [1, 2], [10])
+
+    def test_file(self):
+        """Inventory files use the fixture's line format; blank lines are skipped."""
+        stream = io.StringIO(
+            "Sulfuras, Hand of Ragnaros, -1, 80\n"
+            "\n"
+            "Elixir of the Mongoose, 5, 70\n"
+            "Conjured Mana Cake, 3, 6\n"
+        )
+        result = ingest_file(stream)
+        self.assertEqual([Rejection(2, "quality above 50")], result.rejected)
+        self.assertEqual(
+            ["Sulfuras, Hand of Ragnaros, -1, 80", "Conjured Mana Cake, 3, 6"],
+            [repr(item) for item in result.inventory.to_items()],
+        )
+
+    def test_malformed_rows_are_rejected(self):
+        """Rows that are not sequences and names that are not strings get their own reasons."""
+        result = ingest_rows([None, 5, (b"Aged Brie", 1, 1), (None, 1, 1), (AGED_BRIE, 1, 1)])
+        self.assertEqual(
+            [
+                Rejection(0, "expected name, sell_in and quality"),
+                Rejection(1, "expected name, sell_in and quality"),
+                Rejection(2, "name is not a string"),
+                Rejection(3, "missing name"),
+            ],
+            result.rejected,
+        )
+        self.assertEqual(1, len(result.inventory))
+
+    def test_matches_per_item_baseline(self):
+        """Bulk ingestion accepts and rejects the same rows as the per-item baseline."""
+        rows = ingestion_feed(5000)
+        inventory, rejected = ingest_per_item(rows)
+        result = ingest_rows(rows)
+        self.assertEqual(rejected, [rejection.row for rejection in result.rejected])
+        self.assertEqual([repr(item) for item in inventory.to_items()],
+                         [repr(item) for item in result.inventory.to_items()])
+
+    def test_values_outside_the_column_type_are_rejected(self):
+        """sell_in must fit the 32-bit column, and digit separators are refused."""
+        result = ingest_rows([
+            ("Normal Item", 10 ** 10, 5),
+            ("Normal Item", -2 ** 31 - 1, 5),
+            ("Normal Item", "1_000", 5),
+            ("Normal Item", 2 ** 31 - 1, 5),
+        ])
+        self.assertEqual(
+            [
+                Rejection(0, "sell_in out of range"),
+                Rejection(1, "sell_in out of range"),
+                Rejection(2, "sell_in is not an integer"),
+            ],
+            result.rejected,
+        )
+        self.assertEqual([2 ** 31 - 1], result.inventory.sell_in.tolist())
+
+    @unittest.skipIf(bulk_ingestion.numpy is None, "NumPy is not installed")
+    def test_numpy_columns(self):
+        """Integer NumPy columns give the same result as plain rows."""
+        numpy = bulk_ingestion.numpy
+        rows = [(name, int(sell_in), quality) for name, sell_in, quality in ingestion_feed(1000)]
+        rows += [("", 1, 1), (None, 1, 1), (b"Aged Brie", 1, 1), (SULFURAS, 1, -1),
+                 ("Normal Item", 10 ** 10, 5), ("Normal Item", -2 ** 31, 5)]
+        names, sell_in, quality = zip(*rows)
+        result = ingest_columns(list(names), numpy.array(sell_in), numpy.array(quality))
+        expected = ingest_rows(rows)
+        self.assertEqual(expected.rejected, result.rejected)
+        self.assertEqual(expected.inventory.names, result.inventory.names)
+        self.assertEqual([repr(item) for item in expected.inventory.to_items()],
+                         [repr(item) for item in result.inventory.to_items()])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Tests for the columnar inventory and its buffer exports."""
+import unittest
+
+from columnar_inventory import (
+    AGED_BRIE_ITEM,
+    NORMAL_ITEM,
+    SULFURAS_ITEM,
+    ColumnarInventory,
+)
+from gilded_rose import Item, GildedRose
+from tests.builders import edge_case_items
+
+
+class ColumnarInventoryTest(unittest.TestCase):
+    """Test suite for ColumnarInventory."""
+
+    def test_update_matches_gilded_rose(self):
+        """Thirty days of columnar updates match the in-memory implementation."""
+        expected = edge_case_items()
+        inventory = ColumnarInventory.from_items(edge_case_items())
+        gilded_rose = GildedRose(expected)
+        for _ in range(30):
+            gilded_rose.update_quality()
+            inventory.update_quality()
+        self.assertEqual(
+            [repr(item) for item in expected],
+            [repr(item) for item in inventory.to_items()],
+        )
+
+    def test_names_are_dictionary_encoded(self):
+        """Repeated names share one dictionary entry."""
+        inventory = ColumnarInventory.from_items([
+            Item("Aged Brie", 2, 0),
+            Item("Normal Item", 5, 7),
+            Item("Aged Brie", 1, 3),
+        ])
+        self.assertEqual(["Aged Brie", "Normal Item"], inventory.names)
+        self.assertEqual([0, 1, 0], inventory.name_codes.tolist())
+        self.assertEqual(
+            [AGED_BRIE_ITEM, NORMAL_ITEM, AGED_BRIE_ITEM],
+            inventory.categories.tolist(),
+        )
+
+    def test_views_are_read_only_and_contiguous(self):
+        """Exported columns are contiguous, typed and cannot be written."""
+        inventory = ColumnarInventory.from_items([Item("Sulfuras, Hand of Ragnaros", 0, 80)])
+        view = inventory.quality
+        self.assertTrue(view.readonly)
+        self.assertTrue(view.c_contiguous)
+        self.assertEqual("i", view.format)
+        self.assertEqual([SULFURAS_ITEM], inventory.categories.tolist())
+        with self.assertRaises(TypeError):
+            view[0] = 1
+
+    def test_views_stay_valid_across_updates(self):
+        """A view taken before update_quality shows the updated values."""
+        inventory = ColumnarInventory.from_items([Item("Normal Item", 1, 10)])
+        sell_in, quality = inventory.sell_in, inventory.quality
+        inventory.update_quality()
+        inventory.update_quality()
+        self.assertEqual([-1], sell_in.tolist())
+        self.assertEqual([7], quality.tolist())
+        self.assertEqual(1, len(inventory))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Tests for the snapshot-based concurrent inventory."""
+import threading
+import unittest
+
+from concurrent_inventory import ConcurrentInventory
+from gilded_rose import Item, GildedRose
+
+
+class ConcurrentInventoryTest(unittest.TestCase):
+    """Test suite for snapshot reads during updates."""
+
+    def test_snapshot_matches_gilded_rose(self):
+        """Published days match updating Items in place."""
+        items = [
+            Item("Normal Item", 3, 6),
+            Item("Aged Brie", 2, 0),
+            Item("Sulfuras, Hand of Ragnaros", -1, 80),
+            Item("Backstage passes to a TAFKAL80ETC concert", 5, 49),
+        ]
+        inventory = ConcurrentInventory(items)
+        gilded_rose = GildedRose(items)
+        for _ in range(10):
+            gilded_rose.update_quality()
+            inventory.update_quality()
+        snapshot = inventory.snapshot()
+        self.assertEqual(10, snapshot.day)
+        self.assertEqual([repr(item) for item in items], [repr(state) for state in snapshot.items])
+
+    def test_snapshot_is_not_changed_by_later_updates(self):
+        """A snapshot held by a reader stays on its day."""
+        inventory = ConcurrentInventory([Item("Normal Item", 10, 20)])
+        before = inventory.snapshot()
+        inventory.update_quality()
+        self.assertEqual("Normal Item, 10, 20", repr(before.items[0]))
+        self.assertEqual("Normal Item, 9, 19", repr(inventory.snapshot().items[0]))
+
+    def test_readers_always_see_a_complete_day(self):
+        """Readers racing with the writer never see a mix of two days."""
+        inventory = ConcurrentInventory([Item("Normal Item", 1000, 50) for _ in range(500)])
+        done = threading.Event()
+        torn = []
+
+        def read():
+            while not done.is_set():
+                snapshot = inventory.snapshot()
+                sell_ins = {state.sell_in for state in snapshot.items}
+                if sell_ins != {1000 - snapshot.day}:
+                    torn.append(snapshot.day)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for _ in range(100):
+            inventory.update_quality()
+        done.set()
+        for reader in readers:
+            reader.join()
+
+        self.assertEqual([], torn)
+        self.assertEqual(100, inventory.snapshot().day)
+
+
+if __name__ == "__main__":
+    unittest.main()
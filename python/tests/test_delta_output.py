@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Tests for the delta-encoded fixture output."""
+import io
+import unittest
+
+from delta_output import DAY_HEADER, DeltaEncoder, decode, parse_item, render_day
+from gilded_rose import AGED_BRIE, SULFURAS, Item, GildedRose
+from tests.builders import random_inventory, run_fixture
+
+
+def _render(days, items, encoder=None):
+    """Render days of an inventory, classic or delta-encoded."""
+    out = io.StringIO()
+    for day in range(days):
+        if encoder is not None:
+            out.write(encoder.encode(day, items))
+        else:
+            out.write(render_day(day, items))
+        GildedRose(items).update_quality()
+    return out.getvalue()
+
+
+class DeltaOutputTest(unittest.TestCase):
+    """Test suite for delta encoding and decoding."""
+
+    def test_parse_item_with_comma_in_name(self):
+        """Item names containing ", " are kept whole."""
+        self.assertEqual((SULFURAS, -1, 80), parse_item(SULFURAS + ", -1, 80\n"))
+
+    def test_render_day_matches_fixture(self):
+        """render_day produces the fixture's classic day block."""
+        output = run_fixture(0)[0]
+        items = [Item(*parse_item(line)) for line in output.splitlines()[3:-1]]
+        self.assertEqual(output, "OMGHAI!\n" + render_day(0, items))
+
+    def test_fixture_delta_decodes_to_classic_output(self):
+        """Decoding the fixture's delta output reproduces the classic output."""
+        classic = run_fixture(30)[0]
+        delta = run_fixture(30, "--delta")[0]
+        self.assertEqual(classic, "".join(decode(io.StringIO(delta))))
+
+    def test_delta_is_smaller_than_classic(self):
+        """Steady items are omitted from later days."""
+        classic = run_fixture(30)[0]
+        delta = run_fixture(30, "--delta")[0]
+        self.assertLess(len(delta) * 4, len(classic))
+
+    def test_steady_items_are_omitted(self):
+        """Only items that change their rate appear in a delta day."""
+        items = [
+            Item(SULFURAS, 0, 80),
+            Item("Normal Item", 10, 20),
+            Item(AGED_BRIE, 1, 10),
+        ]
+        encoder = DeltaEncoder()
+        encoder.encode(0, items)
+        GildedRose(items).update_quality()
+        self.assertEqual(
+            DAY_HEADER % 1 + "1, 9, 19\n2, 0, 11\n\n",
+            encoder.encode(1, items),
+        )
+        GildedRose(items).update_quality()
+        self.assertEqual(
+            DAY_HEADER % 2 + "2, -1, 13\n\n",
+            encoder.encode(2, items),
+        )
+
+    def test_random_inventory_round_trip(self):
+        """Random inventories survive a delta round trip byte for byte."""
+        classic = _render(40, random_inventory(200, seed=27))
+        delta = _render(40, random_inventory(200, seed=27), DeltaEncoder())
+        self.assertEqual(classic, "".join(decode(io.StringIO(delta))))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Tests for the cross-implementation differential harness."""
+import io
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "texttests"))
+
+import warm_rig
+from differential_harness import (
+    compare_lines,
+    generate_inventory,
+    items_per_day,
+    main,
+    reference_digests,
+    run_port,
+)
+from gilded_rose import AGED_BRIE, BACKSTAGE_PASSES, SULFURAS, SULFURAS_QUALITY
+
+
+class DifferentialHarnessTest(unittest.TestCase):
+    """Test suite for the harness helpers and a run of the Python port."""
+
+    def test_generate_inventory_is_reproducible_and_mixed(self):
+        """The same seed gives the same inventory, covering every category."""
+        first = [repr(item) for item in generate_inventory(500, seed=7)]
+        self.assertEqual(first, [repr(item) for item in generate_inventory(500, seed=7)])
+        self.assertNotEqual(first, [repr(item) for item in generate_inventory(500, seed=8)])
+
+        items = generate_inventory(500, seed=7)
+        names = {item.name for item in items}
+        self.assertTrue({AGED_BRIE, BACKSTAGE_PASSES, SULFURAS} <= names)
+        self.assertTrue(names - {AGED_BRIE, BACKSTAGE_PASSES, SULFURAS})
+        self.assertTrue(all(item.quality == SULFURAS_QUALITY for item in items if item.name == SULFURAS))
+
+    def test_compare_lines_counts_item_lines(self):
+        """Matching streams report how many item lines were compared."""
+        output = "OMGHAI!\n-------- day 0 --------\nname, sellIn, quality\nA, 1, 2\nB, 3, 4\n\n"
+        self.assertEqual((2, None), compare_lines(io.StringIO(output), io.StringIO(output)))
+
+    def test_compare_lines_reports_first_difference(self):
+        """The first differing line is reported, ignoring line endings."""
+        reference = io.StringIO("OMGHAI!\nA, 1, 2\nB, 3, 4\n")
+        candidate = io.StringIO("OMGHAI!\r\nA, 1, 2\r\nB, 3, 5\r\n")
+        self.assertEqual((1, (3, "B, 3, 4", "B, 3, 5")), compare_lines(reference, candidate))
+
+    def test_compare_lines_reports_truncated_output(self):
+        """A candidate that stops early differs at its missing line."""
+        reference = io.StringIO("OMGHAI!\nA, 1, 2\n")
+        candidate = io.StringIO("OMGHAI!\n")
+        self.assertEqual((0, (2, "A, 1, 2", None)), compare_lines(reference, candidate))
+
+    def test_python_port_matches_reference(self):
+        """The Python fixture, run through its rig, matches the reference."""
+        result = run_port("python", 20, reference_digests(20), items_per_day())
+        self.assertEqual("match", result.status)
+        self.assertIsNone(result.mismatch)
+        self.assertGreater(result.items_per_second, 0)
+
+    def test_broken_port_is_localized(self):
+        """A port whose output diverges is reported with day and line."""
+        broken = warm_rig.Rig("python", [], [sys.executable, "-c", "print('OMGHAI!')"])
+        with mock.patch.dict(warm_rig.RIGS, {"broken": broken}):
+            result = run_port("broken", 3, reference_digests(3), items_per_day())
+        self.assertEqual("MISMATCH", result.status)
+        error, (number, expected, actual) = result.mismatch
+        self.assertEqual(0, error.day)
+        self.assertEqual((2, "-------- day 0 --------", None), (number, expected, actual))
+
+    def test_crashing_port_fails_the_run(self):
+        """A port that exits non-zero after warming up is a failure, not unavailable."""
+        crashing = warm_rig.Rig("python", [], [sys.executable, "-c", "raise SystemExit(1)"])
+        with mock.patch.dict(warm_rig.RIGS, {"crashing": crashing}):
+            result = run_port("crashing", 3, reference_digests(3), items_per_day())
+            with mock.patch("sys.stdout", io.StringIO()):
+                exit_code = main(["crashing", "--days", "3", "--inventory-size", "10"])
+        self.assertEqual("FAILED", result.status)
+        self.assertIsInstance(result.error, subprocess.CalledProcessError)
+        self.assertEqual(1, exit_code)
+
+    def test_port_that_cannot_warm_up_is_unavailable(self):
+        """A failed warm-up means the port is unavailable, which is not a failure."""
+        with mock.patch("warm_rig.warm_up", side_effect=OSError("no toolchain")):
+            result = run_port("python", 3, reference_digests(3), items_per_day())
+        self.assertEqual("unavailable", result.status)
+
+    def test_items_per_day_matches_fixture(self):
+        """The fixture prints its nine items every day."""
+        self.assertEqual(9, items_per_day())
+
+
+if __name__ == "__main__":
+    unittest.main()
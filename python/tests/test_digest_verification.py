@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""Tests for streaming digest verification."""
+import io
+import unittest
+
+from digest_verification import (
+    DigestMismatch,
+    DigestVerifier,
+    DigestWriter,
+    digest_lines,
+    read_digests,
+    write_digests,
+)
+
+
+def _output(days=3, items=10, changed=None):
+    """Render fixture-style output, optionally altering one item line."""
+    lines = ["OMGHAI!\n"]
+    for day in range(days):
+        lines.append("-------- day %s --------\n" % day)
+        lines.append("name, sellIn, quality\n")
+        for index in range(items):
+            quality = 20 - day
+            if changed == (day, index):
+                quality += 1
+            lines.append("Item %d, %d, %d\n" % (index, 10 - day, quality))
+        lines.append("\n")
+    return "".join(lines)
+
+
+def _verify(actual, approved, chunk_size=4):
+    """Stream actual output through a verifier of approved output."""
+    verifier = DigestVerifier(
+        digest_lines(io.StringIO(approved), chunk_size), chunk_size
+    )
+    writer = DigestWriter(on_day=verifier, chunk_size=chunk_size)
+    for start in range(0, len(actual), 7):
+        writer.write(actual[start:start + 7])
+    writer.close()
+    verifier.finish()
+
+
+class DigestVerificationTest(unittest.TestCase):
+    """Test suite for per-day and rolling digests."""
+
+    def test_identical_output_verifies(self):
+        """Output written in arbitrary pieces matches its own digests."""
+        _verify(_output(), _output())
+
+    def test_writer_matches_digest_lines(self):
+        """Writing and re-reading the same output give the same digests."""
+        writer = DigestWriter(chunk_size=4)
+        writer.write(_output())
+        writer.close()
+        self.assertEqual(list(digest_lines(io.StringIO(_output()), 4)), writer.days)
+        self.assertEqual([0, 1, 2], [day.day for day in writer.days])
+        self.assertEqual(3, len(writer.days[0].chunks))
+
+    def test_mismatch_is_localized_to_day_and_item_range(self):
+        """A changed item is reported with its day and chunk range."""
+        with self.assertRaises(DigestMismatch) as raised:
+            _verify(_output(changed=(1, 5)), _output())
+        self.assertEqual(1, raised.exception.day)
+        self.assertEqual((4, 8), raised.exception.item_range)
+
+    def test_changed_preamble_is_reported(self):
+        """A difference before day 0 shows up in the rolling digest."""
+        with self.assertRaises(DigestMismatch) as raised:
+            _verify(_output().replace("OMGHAI!", "HAI!"), _output())
+        self.assertEqual(0, raised.exception.day)
+        self.assertIsNone(raised.exception.item_range)
+
+    def test_missing_day_is_reported(self):
+        """Output that stops early fails verification."""
+        with self.assertRaises(DigestMismatch) as raised:
+            _verify(_output(days=2), _output(days=3))
+        self.assertEqual(2, raised.exception.day)
+
+    def test_extra_items_are_reported(self):
+        """Additional items are localized to the first chunk past the approved ones."""
+        with self.assertRaises(DigestMismatch) as raised:
+            _verify(_output(items=12), _output(items=8))
+        self.assertEqual((8, 12), raised.exception.item_range)
+
+    def test_digests_round_trip_through_json_lines(self):
+        """Stored digests load back unchanged."""
+        days = list(digest_lines(io.StringIO(_output()), 4))
+        stream = io.StringIO()
+        write_digests(days, stream)
+        stream.seek(0)
+        self.assertEqual(days, list(read_digests(stream)))
+
+
+if __name__ == "__main__":
+    unittest.main()
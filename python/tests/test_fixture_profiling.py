@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Tests for the fixture's profiling and allocation tracing modes."""
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+import unittest
+from unittest import mock
+
+from fixture_profiling import AllocationTracker, SamplingProfiler
+from tests.builders import run_fixture
+
+
+def _busy(seconds):
+    """Spin in Python code so the sampler has a stack to record."""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+class FixtureProfilingTest(unittest.TestCase):
+    """Test suite for SamplingProfiler, AllocationTracker and their flags."""
+
+    def test_profiler_writes_collapsed_stacks(self):
+        """Samples are written as "frame;frame count" lines, root first."""
+        with SamplingProfiler(interval=0.001) as profiler:
+            _busy(0.05)
+        out = io.StringIO()
+        profiler.write_collapsed(out)
+        lines = out.getvalue().splitlines()
+        self.assertTrue(lines)
+        busy = [line for line in lines if "test_fixture_profiling.py:_busy" in line]
+        self.assertTrue(busy)
+        stack, count = busy[0].rsplit(" ", 1)
+        self.assertTrue(stack.endswith("test_fixture_profiling.py:_busy"))
+        self.assertGreater(int(count), 0)
+
+    def test_allocation_tracker_keeps_largest_peak_per_phase(self):
+        """Each phase reports the peak allocated while it was active."""
+        tracker = AllocationTracker()
+        tracker.start()
+        try:
+            with tracker.phase("small"):
+                data = bytearray(1000)
+            with tracker.phase("large"):
+                data = bytearray(1000000)
+            with tracker.phase("small"):
+                data = bytearray(10)
+        finally:
+            tracker.stop()
+        del data
+        self.assertGreaterEqual(tracker.peaks["large"], 1000000)
+        self.assertGreaterEqual(tracker.peaks["small"], 1000)
+        self.assertLess(tracker.peaks["small"], 1000000)
+
+    def test_trace_alloc_reports_phases_without_changing_output(self):
+        """--trace-alloc reports on stderr and leaves stdout untouched."""
+        plain, _ = run_fixture(5)
+        traced, report = run_fixture(5, "--trace-alloc")
+        self.assertEqual(plain, traced)
+        self.assertEqual(
+            ["render", "setup", "update"],
+            sorted(line.split(":")[0] for line in report.splitlines()),
+        )
+
+    def test_profile_flag_writes_collapsed_file(self):
+        """--profile writes a (possibly empty) collapsed-stack file."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "fixture.collapsed")
+            plain, _ = run_fixture(5)
+            profiled, _ = run_fixture(5, "--profile", path)
+            self.assertEqual(plain, profiled)
+            self.assertTrue(os.path.exists(path))
+
+    def test_failed_run_still_stops_and_reports(self):
+        """A run that raises still stops tracing and writes its profile."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "fixture.collapsed")
+            with mock.patch("texttest_fixture.GildedRose.update_quality", side_effect=RuntimeError):
+                with self.assertRaises(RuntimeError):
+                    run_fixture(5, "--profile", path, "--trace-alloc")
+            self.assertTrue(os.path.exists(path))
+        self.assertFalse(tracemalloc.is_tracing())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -361,6 +361,23 @@ class GildedRoseTest(unittest.TestCase):
         self.assertEqual(0, items[0].quality)
         self.assertEqual(-1, items[0].sell_in)
 
+    # ==================== STRATEGY LOOKUP ====================
+
+    def test_strategy_for_unknown_name_is_normal(self):
+        """Names without a special strategy use the normal item rules."""
+        gilded_rose = GildedRose([])
+        item = Item("Normal Item", 5, 10)
+        gilded_rose.strategy_for("Normal Item")(item)
+        self.assertEqual(9, item.quality)
+        self.assertEqual(4, item.sell_in)
+
+    def test_strategy_for_special_name(self):
+        """Special names map to their own strategy."""
+        gilded_rose = GildedRose([])
+        item = Item("Aged Brie", 5, 10)
+        gilded_rose.strategy_for("Aged Brie")(item)
+        self.assertEqual(11, item.quality)
+
     # ==================== ITEM REPRESENTATION ====================
 
     def test_item_repr(self):
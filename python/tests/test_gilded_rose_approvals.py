@@ -1,9 +1,17 @@
 import io
+import os
 import sys
 
 from approvaltests import verify
+from digest_verification import DigestVerifier, DigestWriter, digest_lines
 from texttest_fixture import main
 
+APPROVED_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "approved_files",
+    "test_gilded_rose_approvals.test_gilded_rose_approvals.approved.txt",
+)
+
 def test_gilded_rose_approvals():
     orig_sysout = sys.stdout
     try:
@@ -17,5 +25,19 @@ def test_gilded_rose_approvals():
 
     verify(answer)
 
+def test_gilded_rose_approvals_digest():
+    orig_sysout = sys.stdout
+    with open(APPROVED_FILE, encoding="utf-8", newline="") as approved:
+        verifier = DigestVerifier(digest_lines(approved))
+        try:
+            sys.stdout = DigestWriter(on_day=verifier)
+            sys.argv = ["texttest_fixture.py", 30]
+            main()
+            sys.stdout.close()
+        finally:
+            sys.stdout = orig_sysout
+        verifier.finish()
+
 if __name__ == "__main__":
-    test_gilded_rose_approvals()
\ No newline at end of file
+    test_gilded_rose_approvals()
+    test_gilded_rose_approvals_digest()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Tests for the overlapped inventory file pipeline."""
+import io
+import time
+import unittest
+
+from gilded_rose import GildedRose
+from inventory_pipeline import roll_over_file
+from tests.builders import random_inventory
+
+
+def _lines(items):
+    """Serialize items as inventory file lines."""
+    return "".join("%r\n" % (item,) for item in items)
+
+
+class InventoryPipelineTest(unittest.TestCase):
+    """Test suite for roll_over_file."""
+
+    def test_output_matches_sequential_update(self):
+        """The pipelined result equals updating the whole list in one go."""
+        expected = random_inventory(1000, seed=34)
+        source = io.StringIO(_lines(expected))
+        gilded_rose = GildedRose(expected)
+        for _ in range(3):
+            gilded_rose.update_quality()
+
+        destination = io.StringIO()
+        count = roll_over_file(source, destination, days=3, chunk_size=64, depth=2)
+
+        self.assertEqual(1000, count)
+        self.assertEqual(_lines(expected), destination.getvalue())
+
+    def test_empty_file(self):
+        """An empty inventory produces an empty file."""
+        destination = io.StringIO()
+        self.assertEqual(0, roll_over_file(io.StringIO(""), destination))
+        self.assertEqual("", destination.getvalue())
+
+    def test_malformed_line_is_raised(self):
+        """A parse error in the reader surfaces in the caller."""
+        source = io.StringIO(_lines(random_inventory(100, seed=34)) + "not an item\n")
+        with self.assertRaises(ValueError):
+            roll_over_file(source, io.StringIO(), chunk_size=10, depth=1)
+
+    def test_writer_error_is_raised(self):
+        """A write failure stops the pipeline and surfaces in the caller."""
+
+        class BrokenFile:
+            def write(self, text):
+                raise OSError("disk full")
+
+        source = io.StringIO(_lines(random_inventory(1000, seed=34)))
+        with self.assertRaises(OSError):
+            roll_over_file(source, BrokenFile(), chunk_size=10, depth=1)
+
+    def test_reader_is_held_back_by_a_slow_writer(self):
+        """Bounded queues keep the reader a fixed number of chunks ahead of the writer."""
+        chunk_size, depth = 10, 1
+        consumed = []
+        ahead = []
+
+        def counted(text):
+            for line in io.StringIO(text):
+                consumed.append(line)
+                yield line
+
+        class SlowFile(io.StringIO):
+            def write(self, text):
+                ahead.append(len(consumed) - len(self.getvalue().splitlines()))
+                time.sleep(0.005)
+                return super().write(text)
+
+        source = _lines(random_inventory(300, seed=34))
+        destination = SlowFile()
+        roll_over_file(counted(source), destination, chunk_size=chunk_size, depth=depth)
+
+        self.assertEqual(300, len(destination.getvalue().splitlines()))
+        # one chunk in each stage plus full queues between them
+        self.assertLessEqual(max(ahead), (2 * depth + 3) * chunk_size)
+        self.assertLess(max(ahead), 300 - chunk_size)
+
+
+if __name__ == "__main__":
+    unittest.main()
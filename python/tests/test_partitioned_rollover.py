@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""Tests for the coordinator/worker partitioned rollover."""
+import socketserver
+import threading
+import time
+import unittest
+from unittest import mock
+
+import partitioned_rollover
+from gilded_rose import GildedRose
+from partitioned_rollover import Coordinator, WorkerServer, partition, spawn_worker
+from tests.builders import random_inventory
+
+
+def _single_process(items, days):
+    """Roll items over in this process, for comparison."""
+    gilded_rose = GildedRose(items)
+    for _ in range(days):
+        gilded_rose.update_quality()
+    return [repr(item) for item in items]
+
+
+class PartitionedRolloverTest(unittest.TestCase):
+    """Test suite for Coordinator and its workers on localhost."""
+
+    def _start_worker(self):
+        server = WorkerServer()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def test_partition_keeps_order_and_balance(self):
+        """Partitions are contiguous and differ in size by at most one."""
+        chunks = partition(list(range(10)), 3)
+        self.assertEqual([[0, 1, 2, 3], [4, 5, 6], [7, 8, 9]], chunks)
+        self.assertEqual([[0], [1]], partition([0, 1], 5))
+
+    def test_merged_result_matches_single_process(self):
+        """Workers produce the same inventory as a single-process run."""
+        workers = [self._start_worker().server_address for _ in range(3)]
+        items = random_inventory(1000, seed=38)
+        merged = Coordinator(workers).roll_over(items, days=30, partitions=7)
+        self.assertEqual(_single_process(items, 30), [repr(item) for item in merged])
+
+    def test_dead_worker_partitions_are_reassigned(self):
+        """Partitions for an unreachable worker go to the remaining ones."""
+        alive = self._start_worker()
+        dead = WorkerServer()
+        dead_address = dead.server_address
+        dead.server_close()
+
+        items = random_inventory(200, seed=38)
+        coordinator = Coordinator([dead_address, alive.server_address], timeout=5)
+        merged = coordinator.roll_over(items, days=5, partitions=4)
+        self.assertEqual(_single_process(items, 5), [repr(item) for item in merged])
+
+    def test_restarted_worker_process_is_used_again(self):
+        """A worker process restarted on the same port serves new rollovers."""
+        process, address = spawn_worker()
+        self.addCleanup(process.stdout.close)
+        coordinator = Coordinator([address], timeout=5)
+        items = random_inventory(50, seed=38)
+        coordinator.roll_over(items, days=1)
+
+        process.kill()
+        process.wait()
+        restarted, _ = spawn_worker(port=address[1])
+        self.addCleanup(restarted.wait)
+        self.addCleanup(restarted.kill)
+        self.addCleanup(restarted.stdout.close)
+
+        merged = coordinator.roll_over(items, days=2)
+        self.assertEqual(_single_process(items, 2), [repr(item) for item in merged])
+
+    def test_no_reachable_worker_raises(self):
+        """A partition no worker can process fails the rollover."""
+        dead = WorkerServer()
+        address = dead.server_address
+        dead.server_close()
+        with self.assertRaises(ConnectionError):
+            Coordinator([address], timeout=1, rounds=2).roll_over(random_inventory(3, seed=38))
+
+    def test_slow_live_worker_is_not_abandoned(self):
+        """Heartbeats keep a rollover alive past the timeout, without resending it."""
+        worker = self._start_worker()
+        update_quality = GildedRose.update_quality
+        days_run = []
+
+        def slow_update(gilded_rose):
+            days_run.append(None)
+            time.sleep(0.02)
+            update_quality(gilded_rose)
+
+        items = random_inventory(100, seed=38)
+        with mock.patch.object(partitioned_rollover.GildedRose, "update_quality", slow_update):
+            merged = Coordinator([worker.server_address], timeout=0.2).roll_over(items, days=40)
+        self.assertEqual(_single_process(items, 40), [repr(item) for item in merged])
+        self.assertEqual(40, len(days_run))
+
+    def test_malformed_responses_are_retried_then_fail(self):
+        """Malformed worker responses fail the partition instead of crashing."""
+        for reply in (b"[1]\n", b'{"partition": 0}\n', b'{"partition": 0, "items": [5]}\n'):
+            class Handler(socketserver.StreamRequestHandler):
+                def handle(self):
+                    self.rfile.readline()
+                    self.wfile.write(reply)
+
+            server = socketserver.TCPServer(("127.0.0.1", 0), Handler)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            self.addCleanup(server.server_close)
+            self.addCleanup(server.shutdown)
+            coordinator = Coordinator([server.server_address], timeout=1, rounds=1)
+            with self.subTest(reply=reply), self.assertRaises(ConnectionError):
+                coordinator.roll_over(random_inventory(3, seed=38))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""Tests for checkpointed multi-day projections."""
+import os
+import stat
+import tempfile
+import unittest
+from unittest import mock
+
+import projection_checkpoint
+from gilded_rose import GildedRose
+from projection_checkpoint import main, resume_projection, run_projection
+from tests.builders import fixture_items
+
+
+class _Crash(Exception):
+    """Stands in for the process dying mid-run."""
+
+
+class ProjectionCheckpointTest(unittest.TestCase):
+    """Test suite for run_projection and resume_projection."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.output = os.path.join(self.directory.name, "projection.txt")
+        self.checkpoint = os.path.join(self.directory.name, "projection.checkpoint")
+
+    def _read(self, path):
+        with open(path, "rb") as stream:
+            return stream.read()
+
+    def test_matches_approved_fixture_output(self):
+        """An uninterrupted projection matches the approved fixture output."""
+        run_projection(fixture_items(), 30, self.output, self.checkpoint, interval=7)
+        approved = os.path.join(
+            os.path.dirname(__file__),
+            "approved_files",
+            "test_gilded_rose_approvals.test_gilded_rose_approvals.approved.txt",
+        )
+        self.assertEqual(self._read(approved), self._read(self.output))
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+    def test_resume_after_crash_matches_uninterrupted_run(self):
+        """Resuming after a crash produces byte-identical output."""
+        run_projection(fixture_items(), 60, self.output, self.checkpoint, interval=10)
+        expected = self._read(self.output)
+
+        real_update = GildedRose.update_quality
+        calls = []
+
+        def crash_on_day_35(gilded_rose):
+            calls.append(None)
+            if len(calls) == 35:
+                raise _Crash()
+            real_update(gilded_rose)
+
+        with mock.patch.object(projection_checkpoint.GildedRose, "update_quality", crash_on_day_35):
+            with self.assertRaises(_Crash):
+                run_projection(fixture_items(), 60, self.output, self.checkpoint, interval=10)
+        self.assertNotEqual(expected, self._read(self.output))
+
+        items = resume_projection(self.output, self.checkpoint)
+
+        self.assertEqual(expected, self._read(self.output))
+        self.assertFalse(os.path.exists(self.checkpoint))
+        self.assertEqual("Aged Brie, -59, 50", repr(items[1]))
+
+    def test_resume_without_checkpoint_fails(self):
+        """There is nothing to resume once a projection has completed."""
+        run_projection(fixture_items(), 5, self.output, self.checkpoint)
+        with self.assertRaises(FileNotFoundError):
+            resume_projection(self.output, self.checkpoint)
+
+    def test_checkpoint_rename_is_flushed(self):
+        """The directory is fsynced after the checkpoint replaces the old one."""
+        if os.name == "nt":
+            self.skipTest("directories cannot be fsynced on Windows")
+        synced = []
+        fsync = os.fsync
+
+        def record(descriptor):
+            synced.append(stat.S_ISDIR(os.fstat(descriptor).st_mode))
+            fsync(descriptor)
+
+        with mock.patch("os.fsync", record):
+            projection_checkpoint._write_checkpoint(self.checkpoint, {"next_day": 1})
+        self.assertEqual([False, True], synced)
+
+    def test_command_line_resume_takes_only_the_output(self):
+        """--resume needs only the output file; an inventory is refused."""
+        inventory = os.path.join(self.directory.name, "inventory.txt")
+        with open(inventory, "w") as stream:
+            stream.writelines("%r\n" % (item,) for item in fixture_items())
+        main([inventory, self.output, "--days", "5"])
+        expected = self._read(self.output)
+
+        with open(self.output, "ab") as stream:
+            stream.write(b"partial")
+        projection_checkpoint._write_checkpoint(self.checkpoint, {
+            "next_day": 6, "last_day": 5, "interval": 30,
+            "output_size": len(expected), "items": [],
+        })
+        main(["--resume", self.output, "--checkpoint", self.checkpoint])
+        self.assertEqual(expected, self._read(self.output))
+
+        with mock.patch("sys.stderr"), self.assertRaises(SystemExit):
+            main([inventory, self.output, "--resume"])
+        with mock.patch("sys.stderr"), self.assertRaises(SystemExit):
+            main([inventory])
+
+
+if __name__ == "__main__":
+    unittest.main()
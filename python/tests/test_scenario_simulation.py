@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Tests for batched what-if simulation."""
+import unittest
+
+from gilded_rose import AGED_BRIE, BACKSTAGE_PASSES, Item, GildedRose
+from scenario_simulation import grid, sample, simulate
+from tests.builders import NAMES, edge_case_items
+
+
+class ScenarioSimulationTest(unittest.TestCase):
+    """Test suite for grid, sample and simulate."""
+
+    def test_grid_covers_every_combination(self):
+        """A grid has one scenario per (sell_in, quality) pair."""
+        states = grid("Aged Brie", range(2), range(3))
+        self.assertEqual(6, len(states))
+        self.assertIn(("Aged Brie", 1, 2), states)
+
+    def test_sample_is_reproducible(self):
+        """The same seed draws the same scenarios."""
+        draw = lambda: sample("Aged Brie", lambda rng: rng.randint(0, 10),
+                              lambda rng: rng.randint(0, 50), 20, seed=36)
+        self.assertEqual(draw(), draw())
+        self.assertEqual(20, len(draw()))
+
+    def test_statistics_match_individual_runs(self):
+        """Batch statistics equal those of one GildedRose per scenario."""
+        passes = grid(BACKSTAGE_PASSES, range(5, 21), range(10, 50))
+        brie = grid("Aged Brie", range(-4, 12), range(0, 40))
+        statistics = simulate([passes, brie], 30)
+        self.assertEqual(31, len(statistics))
+
+        runs = [[Item(*pass_state), Item(*brie_state)] for pass_state, brie_state in zip(passes, brie)]
+        for day in range(31):
+            for slot in range(2):
+                qualities = [items[slot].quality for items in runs]
+                expired = sum(1 for items in runs if items[slot].sell_in < 0)
+                summary = statistics[day].slots[slot]
+                self.assertEqual(day, statistics[day].day)
+                self.assertAlmostEqual(sum(qualities) / len(qualities), summary.mean_quality)
+                self.assertEqual(min(qualities), summary.min_quality)
+                self.assertEqual(max(qualities), summary.max_quality)
+                self.assertEqual(qualities.count(0), summary.worthless)
+                self.assertEqual(expired, summary.expired)
+            for items in runs:
+                GildedRose(items).update_quality()
+
+        self.assertEqual(BACKSTAGE_PASSES, statistics[30].slots[0].name)
+        self.assertEqual(len(passes), statistics[30].slots[0].worthless)
+
+    def test_kernels_match_gilded_rose_on_edge_cases(self):
+        """Every category matches GildedRose around its thresholds and clamps."""
+        items = edge_case_items()
+        slots = [[(item.name, item.sell_in, item.quality) for item in items if item.name == name]
+                 for name in NAMES]
+        statistics = simulate(slots, 20)
+        gilded_rose = GildedRose(items)
+        for day in range(21):
+            for slot, name in enumerate(NAMES):
+                run = [item for item in items if item.name == name]
+                qualities = [item.quality for item in run]
+                self.assertEqual(
+                    (name, sum(qualities) / len(qualities), min(qualities), max(qualities),
+                     qualities.count(0), sum(1 for item in run if item.sell_in < 0)),
+                    tuple(statistics[day].slots[slot]),
+                )
+            gilded_rose.update_quality()
+
+    def test_slots_may_differ_in_length(self):
+        """Each slot is simulated on its own, whatever its number of scenarios."""
+        brie = grid(AGED_BRIE, range(3), range(48, 51))
+        normal = sample("Normal Item", lambda rng: rng.randint(-3, 3),
+                        lambda rng: rng.randint(0, 5), 50, seed=36)
+        statistics = simulate([brie, normal], 10)
+        for slot, states in enumerate([brie, normal]):
+            items = [Item(*state) for state in states]
+            for _ in range(10):
+                GildedRose(items).update_quality()
+            summary = statistics[10].slots[slot]
+            self.assertEqual(sum(item.quality for item in items) / len(items), summary.mean_quality)
+            self.assertEqual(sum(1 for item in items if item.sell_in < 0), summary.expired)
+
+    def test_empty_slot_is_rejected(self):
+        """A slot needs at least one scenario."""
+        with self.assertRaises(ValueError):
+            simulate([grid(AGED_BRIE, range(2), range(2)), []], 5)
+
+    def test_slot_must_share_one_name(self):
+        """A slot mixing item names is rejected rather than mislabelled."""
+        mixed = grid("Aged Brie", range(2), range(2)) + grid(BACKSTAGE_PASSES, range(2), range(2))
+        with self.assertRaises(ValueError):
+            simulate([mixed], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Tests for the SQLite-backed persistent inventory."""
+import os
+import tempfile
+import unittest
+
+from gilded_rose import Item, GildedRose
+from sqlite_inventory import SqliteInventory
+from tests.builders import edge_case_items
+
+
+class SqliteInventoryTest(unittest.TestCase):
+    """Test suite for set-based rollover in SQLite."""
+
+    def test_items_round_trip(self):
+        """Stored items come back in insertion order."""
+        with SqliteInventory() as inventory:
+            inventory.add_items([Item("Aged Brie", 2, 0), Item("Normal Item", 5, 7)])
+            self.assertEqual(
+                ["Aged Brie, 2, 0", "Normal Item, 5, 7"],
+                [repr(item) for item in inventory.items()],
+            )
+
+    def test_rollover_matches_gilded_rose(self):
+        """Thirty days of SQL rollover match the in-memory implementation."""
+        expected = edge_case_items()
+        gilded_rose = GildedRose(expected)
+        with SqliteInventory(validate=True) as inventory:
+            inventory.add_items(edge_case_items())
+            for _ in range(30):
+                gilded_rose.update_quality()
+                inventory.update_quality()
+            self.assertEqual(
+                [repr(item) for item in expected],
+                [repr(item) for item in inventory.items()],
+            )
+
+    def test_inventory_survives_reopen(self):
+        """A file-backed inventory keeps its state across connections."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "inventory.db")
+            with SqliteInventory(path) as inventory:
+                inventory.add_items([Item("Aged Brie", 1, 10)])
+                inventory.update_quality()
+            with SqliteInventory(path) as inventory:
+                inventory.update_quality()
+                self.assertEqual("Aged Brie, -1, 13", repr(inventory.items()[0]))
+
+    def test_validation_reports_divergence(self):
+        """Validation mode raises when SQL and GildedRose disagree."""
+        with SqliteInventory(validate=True) as inventory:
+            inventory.add_items([Item("Normal Item", 5, 10)])
+            inventory._connection.execute(
+                "CREATE TRIGGER tamper AFTER UPDATE ON items"
+                " BEGIN UPDATE items SET quality = 0 WHERE id = NEW.id AND quality != 0; END"
+            )
+            with self.assertRaises(RuntimeError):
+                inventory.update_quality()
+            self.assertEqual("Normal Item, 5, 10", repr(inventory.items()[0]))
+
+    def test_validation_reports_row_count_change(self):
+        """Validation mode raises and rolls back when rows appear mid-rollover."""
+        with SqliteInventory(validate=True) as inventory:
+            inventory.add_items([Item("Aged Brie", 5, 10)])
+            inventory._connection.execute(
+                "CREATE TRIGGER duplicate AFTER UPDATE ON items WHEN NEW.id = 1"
+                " BEGIN INSERT INTO items (name, sell_in, quality)"
+                " VALUES (NEW.name, NEW.sell_in, NEW.quality); END"
+            )
+            with self.assertRaises(RuntimeError):
+                inventory.update_quality()
+            self.assertEqual(["Aged Brie, 5, 10"], [repr(item) for item in inventory.items()])
+
+
+if __name__ == "__main__":
+    unittest.main()
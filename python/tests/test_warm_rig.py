@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Tests for the shared TextTest warm rig, using the local Python fixture."""
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "texttests"))
+
+import warm_rig
+
+
+class WarmRigTest(unittest.TestCase):
+    """Test suite for warm_rig."""
+
+    def test_command_for_appends_fixture_arguments(self):
+        """Fixture arguments follow the command, except for sbt's one-word task."""
+        self.assertEqual([sys.executable, "texttest_fixture.py", "30"], warm_rig.command_for("python", ["30"]))
+        self.assertEqual(
+            "Test / runMain com.gildedrose.TexttestFixture 30",
+            warm_rig.command_for("scala", ["30"])[-1],
+        )
+
+    def test_read_cases(self):
+        """The suite lists ThirtyDays with its arguments and approved output."""
+        cases = warm_rig.read_cases()
+        self.assertEqual(["ThirtyDays"], [name for name, _, _ in cases])
+        name, args, expected = cases[0]
+        self.assertEqual(["30"], args)
+        self.assertTrue(expected.startswith("OMGHAI!\n-------- day 0 --------\n"))
+
+    def test_run_cases_with_python_fixture(self):
+        """The Python fixture passes every case in the suite."""
+        results = warm_rig.run_cases("python", jobs=2)
+        self.assertEqual(["ThirtyDays"], [result.name for result in results])
+        self.assertTrue(all(result.passed for result in results))
+
+    def test_warm_up_builds_once_until_sources_change(self):
+        """Concurrent warm-ups build once; a newer source triggers a rebuild."""
+        with tempfile.TemporaryDirectory() as home:
+            directory = os.path.join(home, "impl")
+            os.makedirs(directory)
+            source = os.path.join(directory, "source.txt")
+            with open(source, "w"):
+                pass
+            os.utime(source, (0, 0))
+            build = [sys.executable, "-c", "open('builds.txt', 'a').write('x')"]
+            rigs = {"fake": warm_rig.Rig("impl", [build], [])}
+
+            with mock.patch.object(warm_rig, "TEXTTEST_HOME", home), \
+                    mock.patch.dict(warm_rig.RIGS, rigs):
+                threads = [threading.Thread(target=warm_rig.warm_up, args=("fake",)) for _ in range(4)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                warm_rig.warm_up("fake")
+                with open(os.path.join(directory, "builds.txt")) as builds:
+                    self.assertEqual("x", builds.read())
+
+                stamp = os.path.getmtime(os.path.join(directory, warm_rig.WARM_STAMP))
+                os.utime(source, (stamp + 10, stamp + 10))
+                warm_rig.warm_up("fake")
+                with open(os.path.join(directory, "builds.txt")) as builds:
+                    self.assertEqual("xx", builds.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,33 +1,76 @@
 # -*- coding: utf-8 -*-
 from __future__ import print_function
 
+import argparse
+import contextlib
+import sys
+
 from gilded_rose import *
+from delta_output import DeltaEncoder
+from fixture_profiling import AllocationTracker, SamplingProfiler
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Print the Gilded Rose inventory day by day.")
+    parser.add_argument("days", nargs="?", type=int, help="number of days to run after day 0")
+    parser.add_argument("--delta", action="store_true",
+                        help="after day 0, only print items that break their implied rule")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="sample the run and write collapsed stacks for flamegraph tools to PATH")
+    parser.add_argument("--trace-alloc", action="store_true",
+                        help="report peak allocations of the setup, update and render phases on stderr")
+    # sys.argv may contain non-string values when the fixture is driven from tests
+    return parser.parse_args([str(arg) for arg in argv])
 
 
 def main():
-    print("OMGHAI!")
-    items = [
-        Item(name="+5 Dexterity Vest", sell_in=10, quality=20),
-        Item(name="Aged Brie", sell_in=2, quality=0),
-        Item(name="Elixir of the Mongoose", sell_in=5, quality=7),
-        Item(name="Sulfuras, Hand of Ragnaros", sell_in=0, quality=80),
-        Item(name="Sulfuras, Hand of Ragnaros", sell_in=-1, quality=80),
-        Item(name="Backstage passes to a TAFKAL80ETC concert", sell_in=15, quality=20),
-        Item(name="Backstage passes to a TAFKAL80ETC concert", sell_in=10, quality=49),
-        Item(name="Backstage passes to a TAFKAL80ETC concert", sell_in=5, quality=49),
-        Item(name="Conjured Mana Cake", sell_in=3, quality=6),  # <-- :O
-    ]
-    days = 2
-    import sys
-    if len(sys.argv) > 1:
-        days = int(sys.argv[1]) + 1
-    for day in range(days):
-        print("-------- day %s --------" % day)
-        print("name, sellIn, quality")
-        for item in items:
-            print(item)
-        print("")
-        GildedRose(items).update_quality()
+    args = parse_args(sys.argv[1:])
+    profiler = SamplingProfiler() if args.profile else None
+    tracker = AllocationTracker() if args.trace_alloc else None
+    phase = tracker.phase if tracker is not None else lambda name: contextlib.nullcontext()
+
+    try:
+        if profiler is not None:
+            profiler.start()
+        if tracker is not None:
+            tracker.start()
+        with phase("setup"):
+            print("OMGHAI!")
+            items = [
+                Item(name="+5 Dexterity Vest", sell_in=10, quality=20),
+                Item(name="Aged Brie", sell_in=2, quality=0),
+                Item(name="Elixir of the Mongoose", sell_in=5, quality=7),
+                Item(name="Sulfuras, Hand of Ragnaros", sell_in=0, quality=80),
+                Item(name="Sulfuras, Hand of Ragnaros", sell_in=-1, quality=80),
+                Item(name="Backstage passes to a TAFKAL80ETC concert", sell_in=15, quality=20),
+                Item(name="Backstage passes to a TAFKAL80ETC concert", sell_in=10, quality=49),
+                Item(name="Backstage passes to a TAFKAL80ETC concert", sell_in=5, quality=49),
+                Item(name="Conjured Mana Cake", sell_in=3, quality=6),  # <-- :O
+            ]
+            days = 2
+            if args.days is not None:
+                days = args.days + 1
+            encoder = DeltaEncoder() if args.delta else None
+        for day in range(days):
+            with phase("render"):
+                if encoder is not None:
+                    sys.stdout.write(encoder.encode(day, items))
+                else:
+                    print("-------- day %s --------" % day)
+                    print("name, sellIn, quality")
+                    for item in items:
+                        print(item)
+                    print("")
+            with phase("update"):
+                GildedRose(items).update_quality()
+    finally:
+        if tracker is not None:
+            tracker.stop()
+            tracker.report(sys.stderr)
+        if profiler is not None:
+            profiler.stop()
+            with open(args.profile, "w") as collapsed:
+                profiler.write_collapsed(collapsed)
 
 
 if __name__ == "__main__":
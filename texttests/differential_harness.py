@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+"""
+Cross-implementation throughput and differential harness.
+
+The Python GildedRose is the reference. Its fixture output for the requested
+number of days is digested in-process ahead of time (see
+python/digest_verification.py). Every port, the Python fixture included, is
+then run on its own through its warm rig (see warm_rig.py) with stdout going
+to a file. The file is checked afterwards against the reference digests in
+constant memory, so checking does not slow the port down.
+
+Each port is run twice: once for day 0 only, which measures its startup
+time, and once for the full run. Its throughput is the extra item lines the
+full run prints, divided by the extra time it takes. This figure excludes
+JVM, node or sbt startup and is computed the same way for every port, so the
+ports can be compared with each other.
+
+Only ports with an entry in warm_rig.RIGS are run: Java, Kotlin, TypeScript,
+Scala and Python. Other ports, including the Ruby one that config.gr
+enables, have no rig and are not compared. A port whose toolchain cannot
+warm it up is reported as unavailable; a port that fails once warmed up is
+a failure, as is a mismatch.
+
+The port fixtures have their inventory built in, so large generated
+inventories are only fed to the Python engine. Its raw update throughput is
+reported separately and is not comparable with the fixture figures.
+
+    python texttests/differential_harness.py --days 1000 --inventory-size 100000
+"""
+import argparse
+import collections
+import io
+import itertools
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+import warm_rig
+
+sys.path.insert(0, os.path.join(warm_rig.TEXTTEST_HOME, "python"))
+
+import texttest_fixture
+from delta_output import COLUMN_HEADER, DAY_PREFIX
+from digest_verification import DigestMismatch, DigestVerifier, DigestWriter, digest_lines
+from gilded_rose import AGED_BRIE, BACKSTAGE_PASSES, SULFURAS, SULFURAS_QUALITY, GildedRose, Item
+
+REFERENCE = "python"
+NORMAL_NAMES = ["+5 Dexterity Vest", "Elixir of the Mongoose", "Conjured Mana Cake"]
+
+PortResult = collections.namedtuple(
+    "PortResult", "name status items_per_second startup_seconds mismatch error"
+)
+
+
+def generate_inventory(size, seed=0):
+    """Generate a random inventory with every item category represented.
+
+    Args:
+        size: Number of items.
+        seed: Seed for the random generator, so inventories can be replayed.
+
+    Returns:
+        List of Item objects.
+    """
+    rng = random.Random(seed)
+    items = []
+    for _ in range(size):
+        kind = rng.random()
+        if kind < 0.05:
+            items.append(Item(SULFURAS, rng.randint(-5, 5), SULFURAS_QUALITY))
+        elif kind < 0.25:
+            items.append(Item(AGED_BRIE, rng.randint(-10, 30), rng.randint(0, 50)))
+        elif kind < 0.45:
+            items.append(Item(BACKSTAGE_PASSES, rng.randint(-5, 30), rng.randint(0, 50)))
+        else:
+            items.append(Item(rng.choice(NORMAL_NAMES), rng.randint(-10, 30), rng.randint(0, 50)))
+    return items
+
+
+def measure_engine(size, days, seed=0):
+    """Measure the Python engine's update throughput on a generated inventory.
+
+    Returns:
+        Item updates per second, excluding any rendering.
+    """
+    items = generate_inventory(size, seed)
+    gilded_rose = GildedRose(items)
+    started = time.perf_counter()
+    for _ in range(days):
+        gilded_rose.update_quality()
+    elapsed = time.perf_counter() - started
+    return size * days / elapsed if elapsed else float("inf")
+
+
+def compare_lines(reference, candidate):
+    """Compare two line streams as they are read.
+
+    Returns:
+        (number of item lines compared, mismatch) where mismatch is None or
+        a (line number, expected, actual) tuple for the first differing line.
+    """
+    item_lines = 0
+    for number, (want, got) in enumerate(itertools.zip_longest(reference, candidate), 1):
+        want = want.rstrip("\r\n") if want is not None else None
+        got = got.rstrip("\r\n") if got is not None else None
+        if want != got:
+            return item_lines, (number, want, got)
+        if got and not got.startswith(DAY_PREFIX) and got + "\n" != COLUMN_HEADER and ", " in got:
+            item_lines += 1
+    return item_lines, None
+
+
+def _run_reference(days, stdout):
+    """Run the Python fixture in-process, writing its output to stdout."""
+    original = sys.stdout, sys.argv
+    try:
+        sys.stdout = stdout
+        sys.argv = ["texttest_fixture.py", str(days)]
+        texttest_fixture.main()
+    finally:
+        sys.stdout, sys.argv = original
+
+
+def reference_digests(days):
+    """Digest the reference output for the given days.
+
+    Returns:
+        List of DayDigests, one per day.
+    """
+    writer = DigestWriter()
+    _run_reference(days, writer)
+    writer.close()
+    return writer.days
+
+
+def items_per_day():
+    """Count the item lines the fixtures print for each day."""
+    output = io.StringIO()
+    _run_reference(0, output)
+    return compare_lines(io.StringIO(output.getvalue()), io.StringIO(output.getvalue()))[0]
+
+
+def _timed_run(name, days, path):
+    """Run a warmed-up port with stdout in a file, returning the wall time."""
+    with open(path, "w") as stdout:
+        started = time.perf_counter()
+        subprocess.run(
+            warm_rig.command_for(name, [str(days)]),
+            cwd=os.path.join(warm_rig.TEXTTEST_HOME, warm_rig.RIGS[name].directory),
+            stdout=stdout,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+        return time.perf_counter() - started
+
+
+def _first_difference(days, path, directory):
+    """Find the first differing line, only once a digest mismatch is known."""
+    reference_path = os.path.join(directory, "reference.txt")
+    with open(reference_path, "w", newline="") as reference:
+        _run_reference(days, reference)
+    with open(reference_path, newline="") as reference, open(path, newline="") as candidate:
+        return compare_lines(reference, candidate)[1]
+
+
+def run_port(name, days, digests, day_items):
+    """Time one port and check its output against the reference digests.
+
+    Args:
+        name: Rig name from warm_rig.RIGS.
+        days: Days passed to the fixture.
+        digests: Reference DayDigests from reference_digests(days).
+        day_items: Item lines printed per day, from items_per_day().
+
+    Returns:
+        PortResult; status is "match", "MISMATCH", "FAILED" or
+        "unavailable". On a mismatch, mismatch holds the DigestMismatch and
+        the first differing (line number, expected, actual). A port that
+        cannot be warmed up is unavailable; one that fails to run after
+        warming up has FAILED, with the reason in error.
+    """
+    try:
+        warm_rig.warm_up(name)
+    except (OSError, subprocess.CalledProcessError) as error:
+        return PortResult(name, "unavailable", None, None, None, error)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "output.txt")
+        try:
+            startup = _timed_run(name, 0, path)
+            elapsed = _timed_run(name, days, path)
+        except (OSError, subprocess.CalledProcessError) as error:
+            return PortResult(name, "FAILED", None, None, None, error)
+
+        mismatch = None
+        try:
+            verifier = DigestVerifier(digests)
+            with open(path, newline="") as output:
+                for day in digest_lines(line.replace("\r\n", "\n") for line in output):
+                    verifier(day)
+            verifier.finish()
+        except DigestMismatch as error:
+            mismatch = (error, _first_difference(days, path, directory))
+
+    work = elapsed - startup
+    rate = days * day_items / work if work > 0 else float("inf")
+    return PortResult(name, "MISMATCH" if mismatch else "match", rate, startup, mismatch, None)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare Gilded Rose ports with the Python reference.")
+    parser.add_argument("ports", nargs="*", help="ports to run (default: all known rigs)")
+    parser.add_argument("--days", type=int, default=1000, help="days each fixture runs")
+    parser.add_argument("--inventory-size", type=int, default=100000,
+                        help="items in the generated inventory for the Python engine")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the generated inventory")
+    options = parser.parse_args(argv)
+
+    digests = reference_digests(options.days)
+    day_items = items_per_day()
+
+    failures = 0
+    for name in options.ports or sorted(warm_rig.RIGS):
+        result = run_port(name, options.days, digests, day_items)
+        if result.status == "unavailable":
+            print(f"{name}: unavailable")
+            continue
+        if result.status == "FAILED":
+            failures += 1
+            print(f"{name}: FAILED, {result.error}")
+            continue
+        print(f"{name}: {result.status}, {result.items_per_second:,.0f} item lines/s "
+              f"after {result.startup_seconds:.3f}s startup")
+        if result.mismatch:
+            failures += 1
+            error, difference = result.mismatch
+            print(f"  {error}")
+            if difference:
+                number, want, got = difference
+                print(f"  line {number}: expected {want!r}, got {got!r}")
+
+    rate = measure_engine(options.inventory_size, options.days, options.seed)
+    print(f"{REFERENCE} engine alone: {rate:,.0f} item updates/s "
+          f"({options.inventory_size} items x {options.days} days, no rendering)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
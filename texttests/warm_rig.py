@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+"""
+Shared TextTest rig that avoids paying build-tool startup on every run.
+
+The per-language texttest_rig.py scripts delegate to this module. Each
+implementation is built once by a warm-up step, which is repeated only when
+its sources change, and every later invocation starts just the fixture:
+
+  - Java: compiled by Gradle, then run directly with `java -cp`.
+  - Kotlin: installed with `gradlew installDist`, then run from its start script.
+  - TypeScript: compiled once with tsc, then run with plain `node`.
+  - Scala: run through `sbt --client`, which reuses a warm sbt server.
+  - Python: runs the fixture directly, with no warm-up step.
+
+Usage as a rig (what TextTest calls):
+
+    python texttests/warm_rig.py java 30
+
+Running every case listed in texttests/testsuite.gr in parallel:
+
+    python texttests/warm_rig.py --run-cases java --jobs 4
+"""
+import argparse
+import collections
+import concurrent.futures
+import contextlib
+import os
+import subprocess
+import sys
+import time
+
+TEXTTEST_HOME = os.environ.get(
+    "TEXTTEST_HOME", os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+# Windows launchers are batch files, which cannot be started without a shell
+# unless their extension is given.
+WINDOWS = os.name == "nt"
+GRADLEW = "gradlew.bat" if WINDOWS else "gradlew"
+NPX = "npx.cmd" if WINDOWS else "npx"
+SBT = "sbt.bat" if WINDOWS else "sbt"
+KOTLIN_SCRIPT = "Kotlin.bat" if WINDOWS else "Kotlin"
+WARM_STAMP = ".texttest-warm"
+WARM_LOCK = ".texttest-warm.lock"
+# Directories holding build output rather than sources.
+BUILD_DIRECTORIES = {".git", ".gradle", ".texttest-build", "build", "node_modules", "target", "bin"}
+
+Rig = collections.namedtuple("Rig", "directory warm_up command")
+CaseResult = collections.namedtuple("CaseResult", "name passed seconds output")
+
+RIGS = {
+    "java": Rig(
+        "Java",
+        [[os.path.join(".", GRADLEW), "-q", "testClasses"]],
+        ["java", "-cp", os.pathsep.join(["build/classes/java/test", "build/classes/java/main"]),
+         "com.gildedrose.TexttestFixture"],
+    ),
+    "kotlin": Rig(
+        "Kotlin",
+        [[os.path.join(".", GRADLEW), "-q", "installDist"]],
+        [os.path.join("build", "install", "Kotlin", "bin", KOTLIN_SCRIPT)],
+    ),
+    "typescript": Rig(
+        "TypeScript",
+        [[NPX, "tsc", "--outDir", ".texttest-build", "--module", "commonjs", "--target", "es2015",
+          "--esModuleInterop", "test/golden-master-text-test.ts"]],
+        ["node", os.path.join(".texttest-build", "test", "golden-master-text-test.js")],
+    ),
+    "scala": Rig(
+        "scala",
+        [[SBT, "--client", "Test / compile"]],
+        [SBT, "--client", "-warn", "Test / runMain com.gildedrose.TexttestFixture"],
+    ),
+    "python": Rig(
+        "python",
+        [],
+        [sys.executable, "texttest_fixture.py"],
+    ),
+}
+
+
+def _newest_source_mtime(directory):
+    """Return the latest modification time of any source file in directory."""
+    newest = 0.0
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [name for name in dirs if name not in BUILD_DIRECTORIES]
+        for name in files:
+            if name not in (WARM_STAMP, WARM_LOCK):
+                newest = max(newest, os.path.getmtime(os.path.join(root, name)))
+    return newest
+
+
+@contextlib.contextmanager
+def _exclusive_lock(path):
+    """Hold an exclusive lock on path, waiting for other processes to release it."""
+    with open(path, "a+b") as lock_file:
+        if WINDOWS:
+            import msvcrt
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    pass  # LK_LOCK gives up after about ten seconds
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _is_warm(directory):
+    """Tell whether the stamp in directory is newer than every source file."""
+    stamp = os.path.join(directory, WARM_STAMP)
+    return os.path.exists(stamp) and os.path.getmtime(stamp) >= _newest_source_mtime(directory)
+
+
+def warm_up(name):
+    """Run an implementation's warm-up steps unless its build is current.
+
+    The warm-up is recorded by a stamp file in the implementation directory
+    and repeated whenever a source file is newer than the stamp. A file lock
+    keeps concurrent rigs from building the same implementation at once;
+    whoever waited on the lock finds the build current and skips it.
+    """
+    rig = RIGS[name]
+    if not rig.warm_up:
+        return
+    directory = os.path.join(TEXTTEST_HOME, rig.directory)
+    if _is_warm(directory):
+        return
+    with _exclusive_lock(os.path.join(directory, WARM_LOCK)):
+        if _is_warm(directory):
+            return
+        for step in rig.warm_up:
+            subprocess.run(step, cwd=directory, check=True)
+        with open(os.path.join(directory, WARM_STAMP), "w"):
+            pass
+
+
+def command_for(name, args):
+    """Build the fixture command line for an implementation."""
+    rig = RIGS[name]
+    if name == "scala":
+        # sbt --client takes the whole task, arguments included, as one word.
+        return rig.command[:-1] + [" ".join([rig.command[-1], *args])]
+    return rig.command + list(args)
+
+
+def run_fixture(name, args, warm=True, **kwargs):
+    """Run an implementation's fixture once, after warming it up if needed.
+
+    Pass warm=False when the caller has already warmed the implementation
+    up. Extra keyword arguments are passed on to subprocess.run.
+    """
+    if warm:
+        warm_up(name)
+    return subprocess.run(
+        command_for(name, args), cwd=os.path.join(TEXTTEST_HOME, RIGS[name].directory), **kwargs
+    )
+
+
+def read_cases(texttests=os.path.join(TEXTTEST_HOME, "texttests")):
+    """Read the test cases listed in testsuite.gr.
+
+    Returns a list of (case name, fixture arguments, expected stdout).
+    """
+    cases = []
+    with open(os.path.join(texttests, "testsuite.gr")) as suite:
+        names = [line.strip() for line in suite if line.strip() and not line.startswith("#")]
+    for name in names:
+        case = os.path.join(texttests, name)
+        with open(os.path.join(case, "options.gr")) as options:
+            args = options.read().split()
+        with open(os.path.join(case, "stdout.gr"), newline="") as stdout:
+            expected = stdout.read().replace("\r\n", "\n")
+        cases.append((name, args, expected))
+    return cases
+
+
+def run_case(name, case):
+    """Run one test case and compare its stdout with the approved output.
+
+    The implementation must already be warmed up.
+    """
+    case_name, args, expected = case
+    started = time.perf_counter()
+    completed = run_fixture(name, args, warm=False, capture_output=True, text=True)
+    output = completed.stdout.replace("\r\n", "\n")
+    return CaseResult(case_name, output == expected, time.perf_counter() - started, output)
+
+
+def run_cases(name, jobs=None, cases=None):
+    """Warm an implementation up once, then run independent cases in parallel.
+
+    Returns one CaseResult per case, in suite order.
+    """
+    warm_up(name)
+    cases = read_cases() if cases is None else cases
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(lambda case: run_case(name, case), cases))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a Gilded Rose TextTest fixture from a warm build.")
+    parser.add_argument("implementation", choices=sorted(RIGS))
+    parser.add_argument("args", nargs="*", help="arguments passed on to the fixture")
+    parser.add_argument("--run-cases", action="store_true",
+                        help="run every case in texttests/testsuite.gr and report the results")
+    parser.add_argument("--jobs", type=int, default=None, help="number of cases to run in parallel")
+    options = parser.parse_args(argv)
+
+    if not options.run_cases:
+        return run_fixture(options.implementation, options.args).returncode
+
+    failures = 0
+    for result in run_cases(options.implementation, options.jobs):
+        status = "succeeded" if result.passed else "FAILED"
+        failures += not result.passed
+        print(f"{options.implementation} test-case {result.name} {status} in {result.seconds:.3f}s")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())